@@ -6,7 +6,7 @@ import asyncio
 import logging
 from collections import deque
 from collections.abc import Sequence
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, override
 
 import discord
 import mafic
@@ -25,6 +25,7 @@ from .queue import QueueManager, RepeatManager
 
 if TYPE_CHECKING:
     from discord.abc import Connectable
+    from mafic.typings import PlayerUpdateState
 
 logger = logging.getLogger(__name__)
 
@@ -48,6 +49,9 @@ class MusicPlayer(mafic.Player[discord.Client]):
         self._exception_attempt_ids: set[int] = set()
         self._transition_lock = asyncio.Lock()
         self._is_stale = False
+        self._connected_event = asyncio.Event()
+        # mafic only assigns this from Lavalink's reply to the first update.
+        self._volume: int | None = None
 
     @property
     def current_attempt(self) -> PlaybackAttempt | None:
@@ -63,10 +67,40 @@ class MusicPlayer(mafic.Player[discord.Client]):
         """Return whether this player has been detached from the active lifecycle."""
         return self._is_stale
 
+    @property
+    def applied_volume(self) -> int | None:
+        """Return the volume Lavalink last confirmed for this player, if any."""
+        return self._volume
+
     def mark_stale(self) -> None:
         """Mark this player as no longer safe for reuse."""
         self._is_stale = True
 
+    @override
+    def update_state(self, state: PlayerUpdateState) -> None:
+        super().update_state(state)
+        if self.connected:
+            self._connected_event.set()
+        else:
+            self._connected_event.clear()
+            self._volume = None
+
+    @override
+    def cleanup(self) -> None:
+        # mafic drops the connection here without a player update.
+        super().cleanup()
+        self._connected_event.clear()
+        self._volume = None
+
+    async def wait_until_connected(self, timeout: float) -> bool:
+        """Wait until Lavalink reports the voice connection, up to ``timeout``."""
+        if not self.connected:
+            try:
+                await asyncio.wait_for(self._connected_event.wait(), timeout)
+            except TimeoutError:
+                return False
+        return self.connected
+
     async def move_to(
         self, channel: discord.abc.Snowflake | None, *, timeout: float = 30.0
     ) -> None:
@@ -6,9 +6,12 @@ import random
 from collections import deque
 from collections.abc import Iterable, Iterator, Sequence
 from dataclasses import dataclass
+from operator import attrgetter
 
 from .models import QueueEntry, RepeatMode
 
+_entry_track_length = attrgetter("track.length")
+
 
 class QueueManager:
     """Manages the track queue using a deque."""
@@ -37,7 +40,7 @@ class QueueManager:
     @property
     def duration(self) -> int:
         """Total duration of queue in milliseconds."""
-        return sum(entry.track.length for entry in self._queue)
+        return sum(map(_entry_track_length, self._queue))
 
     def append(self, entry: QueueEntry) -> None:
         """Add a single track to the end of the queue."""
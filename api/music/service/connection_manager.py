@@ -51,6 +51,9 @@ class ConnectionManager:
             await self._cleanup_unavailable_nodes()
 
             logger.debug("Initializing Mafic node pool")
+            # The node lazily creates one aiohttp session and reuses it for every
+            # REST call. Do not inject a shared session: Node.close() closes it,
+            # and failed nodes are closed here on every unsuccessful attempt.
             node = mafic.Node(
                 host=config.LAVALINK_HOST,
                 port=config.LAVALINK_PORT,
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
+import random
+import time
 from collections.abc import Sequence
 from typing import TypeVar
 
@@ -9,6 +12,7 @@ import discord
 import mafic
 from discord.ext import commands
 
+import config
 from api.music.errors import (
     EXPECTED_LAVALINK_IO_ERRORS,
     classify_music_exception,
@@ -41,7 +45,7 @@ from api.music.service.event_handlers import MusicEventHandlers
 from api.music.service.state_manager import StateManager
 from api.music.service.ui_orchestrator import UIOrchestrator
 from api.music.session_events import dispatch_music_session_end
-from repositories.volume_repository import VolumeRepository
+from repositories.volume_repository import VolumeData, VolumeRepository
 
 logger = logging.getLogger(__name__)
 
@@ -52,6 +56,18 @@ EXPECTED_PLAY_ERRORS = (
     mafic.PlayerException,
     NodeNotConnectedError,
 )
+VOLUME_APPLY_TIMEOUT_SECONDS = 1.0
+# Delays before each retry of a search the source reported as a transient failure.
+SEARCH_RETRY_DELAYS_SECONDS = (0.5, 1.0)
+SEARCH_RETRY_JITTER_SECONDS = 0.25
+SEARCH_CACHE_TTL_SECONDS = 60.0
+SEARCH_CACHE_MAX_SIZE = 256
+# Lavalink REST searches allowed at once; further /play requests wait their turn.
+SEARCH_CONCURRENCY_LIMIT = 4
+
+type SearchResult = list[mafic.Track] | mafic.Playlist | None
+# Searches are shared per Lavalink node: (node label, query).
+type SearchKey = tuple[str | None, str]
 
 
 class CoreMusicService:
@@ -75,6 +91,10 @@ class CoreMusicService:
         self.events = event_handlers
         self.ui = ui_orchestrator
         self._initialized = False
+        self._search_inflight: dict[SearchKey, asyncio.Task[SearchResult]] = {}
+        self._search_cache: dict[SearchKey, tuple[float, SearchResult]] = {}
+        self._search_slots = asyncio.Semaphore(SEARCH_CONCURRENCY_LIMIT)
+        self.state.set_auto_leave_callback(self._auto_leave)
 
     async def initialize(self) -> None:
         """Initialize the service and its components."""
@@ -84,7 +104,8 @@ class CoreMusicService:
 
         self.events.setup()
         self._initialized = True
-        self.connection.start_lazy_connect()
+        if config.LAVALINK_CONNECT_ON_STARTUP:
+            self.connection.start_lazy_connect()
         logger.info("CoreMusicService initialized.")
 
     def get_player(self, guild_id: int) -> MusicPlayer | None:
@@ -114,15 +135,15 @@ class CoreMusicService:
         return result, old_channel
 
     async def _apply_volume(self, player: MusicPlayer, volume: int) -> None:
-        """Apply volume with a short retry while the voice connection stabilizes."""
-        retry_delays = (0.0, 0.3, 0.6)
-        for delay in retry_delays:
-            if delay:
-                await asyncio.sleep(delay)
+        """Apply volume once Lavalink reports the voice connection as established."""
+        if player.applied_volume == volume:
+            return
+        for _ in range(2):
+            if not await player.wait_until_connected(VOLUME_APPLY_TIMEOUT_SECONDS):
+                break
             try:
-                if player.connected:
-                    await player.set_volume(volume)
-                    return
+                await player.set_volume(volume)
+                return
             except mafic.PlayerNotConnected:
                 continue
 
@@ -226,7 +247,7 @@ class CoreMusicService:
         *,
         placement: QueuePlacement,
     ) -> MusicResult[PlayResponseData | VoiceJoinResult]:
-        result = await player.fetch_tracks(query)
+        result = await self._fetch_tracks(player, query)
         if not result:
             return MusicResult(MusicResultStatus.FAILURE, "Nothing found")
         if isinstance(result, mafic.Playlist):
@@ -247,6 +268,75 @@ class CoreMusicService:
             placement=placement,
         )
 
+    async def _fetch_tracks(self, player: MusicPlayer, query: str) -> SearchResult:
+        """Search tracks, sharing in-flight and recent results for the same query.
+
+        Only successful results are shared: a caller joining another player's
+        search that fails searches again on its own player, so a transport
+        error is always raised for the player that hit it.
+        """
+        node = self.connection.get_player_node(player)
+        key: SearchKey = (node.label if node is not None else None, query)
+        cached = self._search_cache.get(key)
+        if cached is not None:
+            expires_at, result = cached
+            if expires_at > time.monotonic():
+                return result
+            del self._search_cache[key]
+
+        task = self._search_inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._search_with_retry(player, query))
+            self._search_inflight[key] = task
+            task.add_done_callback(functools.partial(self._on_search_done, key))
+            # Shielded so one cancelled caller does not abort the shared search.
+            return await asyncio.shield(task)
+
+        try:
+            return await asyncio.shield(task)
+        except Exception:
+            logger.debug("Shared search for %r failed; searching again", query)
+        return await self._search_with_retry(player, query)
+
+    def _on_search_done(self, key: SearchKey, task: asyncio.Task[SearchResult]) -> None:
+        self._search_inflight.pop(key, None)
+        if task.cancelled() or task.exception() is not None:
+            return
+        result = task.result()
+        if not result:
+            return
+        if len(self._search_cache) >= SEARCH_CACHE_MAX_SIZE:
+            del self._search_cache[next(iter(self._search_cache))]
+        self._search_cache[key] = (
+            time.monotonic() + SEARCH_CACHE_TTL_SECONDS,
+            result,
+        )
+
+    async def _search_with_retry(self, player: MusicPlayer, query: str) -> SearchResult:
+        """Search tracks, retrying with jittered backoff on non-common load errors.
+
+        COMMON load errors (unavailable or private videos) are final, and node
+        transport errors are left to the caller, which invalidates the node.
+        """
+        for delay in SEARCH_RETRY_DELAYS_SECONDS:
+            try:
+                return await self._search_once(player, query)
+            except mafic.TrackLoadException as exc:
+                if exc.severity.upper() == "COMMON":
+                    raise
+                logger.info(
+                    "Retrying track search in guild %s after %s load error",
+                    player.guild.id,
+                    exc.severity,
+                )
+            jitter = random.uniform(0, SEARCH_RETRY_JITTER_SECONDS)  # noqa: S311
+            await asyncio.sleep(delay + jitter)
+        return await self._search_once(player, query)
+
+    async def _search_once(self, player: MusicPlayer, query: str) -> SearchResult:
+        async with self._search_slots:
+            return await player.fetch_tracks(query)
+
     async def _enqueue_playlist(
         self,
         player: MusicPlayer,
@@ -493,11 +583,18 @@ class CoreMusicService:
         )
 
     async def set_volume(self, guild_id: int, volume: int) -> MusicResult[int]:
-        from repositories.volume_repository import VolumeData
+        # The saved value and the live player are independent; update them together.
+        # gather cancels both if the command is cancelled, and always collects the
+        # save's outcome even when the player update fails first.
+        _, result = await asyncio.gather(
+            self.volume_repo.save(VolumeData(guild_id=guild_id, volume=volume)),
+            self._set_player_volume(guild_id, volume),
+        )
+        return result
 
-        await self.volume_repo.save(VolumeData(guild_id=guild_id, volume=volume))
+    async def _set_player_volume(self, guild_id: int, volume: int) -> MusicResult[int]:
         player = self.connection.get_player(guild_id)
-        if player:
+        if player and player.applied_volume != volume:
             try:
                 await player.set_volume(volume)
             except EXPECTED_LAVALINK_IO_ERRORS as exc:
@@ -582,14 +679,11 @@ class CoreMusicService:
             safe_error.message,
         )
 
-    async def check_auto_leave(self) -> None:
-        """Check for guilds that have been empty for too long."""
-        expired_guild_ids = await self.state.check_auto_leave()
-        for guild_id in expired_guild_ids:
-            guild = self.bot.get_guild(guild_id)
-            if guild:
-                await self.leave(guild)
-            self.state.clear_expired_timers([guild_id])
+    async def _auto_leave(self, guild_id: int) -> None:
+        """Leave a guild whose voice channel stayed empty for too long."""
+        guild = self.bot.get_guild(guild_id)
+        if guild:
+            await self.leave(guild)
 
     async def end_session(self, guild_id: int) -> None:
         """End the music session and dispatch the event."""
@@ -602,6 +696,7 @@ class CoreMusicService:
             if guild.voice_client:
                 await self.connection.disconnect(guild, force=True)
         self.events.cleanup()
+        self.state.cancel_all_timers()
         await self.connection.cleanup()
         self._initialized = False
         logger.info("CoreMusicService cleaned up.")
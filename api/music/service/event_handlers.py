@@ -446,13 +446,13 @@ class MusicEventHandlers:
         after: discord.VoiceState,
         bot_channel: discord.abc.Connectable,
     ) -> bool:
-        is_relevant = before.channel == bot_channel or after.channel == bot_channel
-
-        if before.channel == bot_channel == after.channel:
-            if before.deaf != after.deaf or before.self_deaf != after.self_deaf:
-                is_relevant = True
-
-        return is_relevant
+        if before.channel == after.channel:
+            # Same channel: only a deafen change can alter who is listening;
+            # mute, stream and video toggles cannot.
+            return before.channel == bot_channel and (
+                before.deaf != after.deaf or before.self_deaf != after.self_deaf
+            )
+        return before.channel == bot_channel or after.channel == bot_channel
 
     async def _on_voice_state_update(
         self,
@@ -469,9 +469,8 @@ class MusicEventHandlers:
         guild = member.guild
         voice_client = guild.voice_client
 
-        if not voice_client or not isinstance(
-            voice_client, mafic.Player
-        ):  # MusicPlayer
+        # Only our own live players drive auto-leave; skip any other voice client.
+        if not isinstance(voice_client, MusicPlayer) or voice_client.is_stale:
             return
 
         bot_channel = voice_client.channel
@@ -509,13 +508,15 @@ class MusicEventHandlers:
     def _empty_channel_reason(
         self, channel: discord.VoiceChannel | discord.StageChannel
     ) -> str | None:
-        human_members = [member for member in channel.members if not member.bot]
-        if not human_members:
-            return "empty"
-        if all(
-            member.voice.self_deaf or member.voice.deaf
-            for member in human_members
-            if member.voice is not None
-        ):
-            return "all_deafened"
-        return None
+        # One pass over the raw voice states, stopping at the first human who
+        # can hear the bot; channel.members would rebuild a member list first.
+        has_human = False
+        get_member = channel.guild.get_member
+        for user_id, voice in channel.voice_states.items():
+            member = get_member(user_id)
+            if member is None or member.bot:
+                continue
+            has_human = True
+            if not (voice.self_deaf or voice.deaf):
+                return None
+        return "all_deafened" if has_human else "empty"
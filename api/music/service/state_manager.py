@@ -1,21 +1,19 @@
 from __future__ import annotations
 
+import asyncio
 import datetime
 import logging
-import time
-from typing import TypedDict
+from collections.abc import Awaitable, Callable
 
 import mafic
 from discord.utils import utcnow
 
+import config
 from api.music.models import MusicSession, PlaybackAttempt
 
 logger = logging.getLogger(__name__)
 
-
-class EmptyTimerInfo(TypedDict):
-    timestamp: float
-    reason: str | None
+type AutoLeaveCallback = Callable[[int], Awaitable[None]]
 
 
 class StateManager:
@@ -26,7 +24,13 @@ class StateManager:
         self._track_start_times_dt: dict[tuple[int, int], datetime.datetime] = {}
 
         # Auto-leave tracking
-        self.empty_channel_timers: dict[int, EmptyTimerInfo] = {}
+        self._leave_handles: dict[int, asyncio.TimerHandle] = {}
+        self._leave_tasks: set[asyncio.Task[None]] = set()
+        self._auto_leave_callback: AutoLeaveCallback | None = None
+
+    def set_auto_leave_callback(self, callback: AutoLeaveCallback | None) -> None:
+        """Set the coroutine run for a guild when its auto-leave timer fires."""
+        self._auto_leave_callback = callback
 
     def get_session(self, guild_id: int) -> MusicSession | None:
         return self.sessions.get(guild_id)
@@ -86,42 +90,47 @@ class StateManager:
         logger.debug("Recorded history: %s (Skipped: %s)", track.title, skipped)
 
     def is_timer_active(self, guild_id: int) -> bool:
-        return guild_id in self.empty_channel_timers
+        return guild_id in self._leave_handles
 
     def start_timer(self, guild_id: int, reason: str | None) -> None:
-        if guild_id not in self.empty_channel_timers:
-            self.empty_channel_timers[guild_id] = EmptyTimerInfo(
-                timestamp=time.monotonic(),
-                reason=reason,
-            )
+        """Schedule auto-leave for a guild unless a timer is already pending."""
+        if guild_id in self._leave_handles:
+            return
+        loop = asyncio.get_running_loop()
+        self._leave_handles[guild_id] = loop.call_later(
+            config.MUSIC_AUTO_LEAVE_TIMEOUT,
+            self._on_timer_expired,
+            guild_id,
+            reason,
+        )
 
     def cancel_timer(self, guild_id: int) -> None:
-        self.empty_channel_timers.pop(guild_id, None)
-
-    def get_expired_timers(
-        self, timeout_duration: float
-    ) -> list[tuple[int, str | None]]:
-        """Return list of (guild_id, reason) for expired timers."""
-        expired: list[tuple[int, str | None]] = []
-        current_time = time.monotonic()
-        for guild_id, info in self.empty_channel_timers.items():
-            if current_time - info["timestamp"] > timeout_duration:
-                expired.append((guild_id, info["reason"]))
-        return expired
-
-    def clear_expired_timers(self, expired_guild_ids: list[int]) -> None:
-        """Clear the specified expired timers."""
-        for guild_id in expired_guild_ids:
-            self.empty_channel_timers.pop(guild_id, None)
-
-    async def check_auto_leave(self) -> list[int]:
-        """Check for guilds that have been empty for too long."""
-        import config
-
-        expired_timers = self.get_expired_timers(config.MUSIC_AUTO_LEAVE_TIMEOUT)
-        expired_guild_ids = [guild_id for guild_id, _ in expired_timers]
-
-        for guild_id, reason in expired_timers:
-            logger.info(f"Auto-leave timer expired for guild {guild_id} ({reason})")
-
-        return expired_guild_ids
+        handle = self._leave_handles.pop(guild_id, None)
+        if handle is not None:
+            handle.cancel()
+
+    def cancel_all_timers(self) -> None:
+        """Cancel every pending auto-leave timer."""
+        for handle in self._leave_handles.values():
+            handle.cancel()
+        self._leave_handles.clear()
+
+    def _on_timer_expired(self, guild_id: int, reason: str | None) -> None:
+        self._leave_handles.pop(guild_id, None)
+        logger.info("Auto-leave timer expired for guild %s (%s)", guild_id, reason)
+
+        callback = self._auto_leave_callback
+        if callback is None:
+            return
+        task = asyncio.create_task(
+            self._run_auto_leave(callback, guild_id),
+            name=f"music-auto-leave-{guild_id}",
+        )
+        self._leave_tasks.add(task)
+        task.add_done_callback(self._leave_tasks.discard)
+
+    async def _run_auto_leave(self, callback: AutoLeaveCallback, guild_id: int) -> None:
+        try:
+            await callback(guild_id)
+        except Exception:
+            logger.exception("Auto-leave failed for guild %s", guild_id)
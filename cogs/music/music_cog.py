@@ -1,13 +1,13 @@
 """Music Cog Controller."""
 
 import logging
+from collections.abc import Awaitable, Callable
 from typing import override
 
 import discord
 from discord import Interaction, Member, app_commands
-from discord.ext import commands, tasks
+from discord.ext import commands
 
-import config
 from api.music import (
     MUSIC_SERVICE_UNAVAILABLE_MESSAGE,
     MusicResultStatus,
@@ -62,25 +62,41 @@ from .views import (
 
 logger = logging.getLogger(__name__)
 
+type SimpleFeedbackSender = Callable[[Interaction, str], Awaitable[None]]
+
+
+def _member_voice_channel(
+    user: discord.User | Member,
+) -> discord.VoiceChannel | discord.StageChannel | None:
+    """Return the voice channel a guild member is in, resolving ``voice`` once."""
+    if not isinstance(user, Member):
+        return None
+    voice = user.voice
+    if voice is None:
+        return None
+    return voice.channel
+
+
+_VOICE_RESULT_MESSAGES: dict[VoiceCheckResult, str] = {
+    VoiceCheckResult.ALREADY_CONNECTED: "Уже подключён к {0}",
+    VoiceCheckResult.CHANNEL_EMPTY: "Голосовой канал {0} пуст!",
+    VoiceCheckResult.CONNECTION_FAILED: "Ошибка подключения к {0}",
+    VoiceCheckResult.MUSIC_SERVICE_UNAVAILABLE: MUSIC_SERVICE_UNAVAILABLE_MESSAGE,
+    VoiceCheckResult.TIMEOUT: "Время подключения к {0} **истекло**"
+    + "\n*Попробуйте сменить регион этого канала!*",
+    VoiceCheckResult.MOVED_CHANNELS: "Переместился {1} -> {0}",
+    VoiceCheckResult.SUCCESS: "Успешно подключился к {0}",
+    VoiceCheckResult.USER_NOT_IN_VOICE: "Вы должны быть в голосовом канале!",
+    VoiceCheckResult.USER_NOT_MEMBER: "Неверный тип пользователя",
+}
+
 
 def _format_voice_result_message(
     result: VoiceCheckResult,
     to_channel: discord.abc.GuildChannel | None,
     from_channel: discord.abc.GuildChannel | None,
 ) -> str:
-    messages = {
-        VoiceCheckResult.ALREADY_CONNECTED: "Уже подключён к {0}",
-        VoiceCheckResult.CHANNEL_EMPTY: "Голосовой канал {0} пуст!",
-        VoiceCheckResult.CONNECTION_FAILED: "Ошибка подключения к {0}",
-        VoiceCheckResult.MUSIC_SERVICE_UNAVAILABLE: MUSIC_SERVICE_UNAVAILABLE_MESSAGE,
-        VoiceCheckResult.TIMEOUT: "Время подключения к {0} **истекло**"
-        + "\n*Попробуйте сменить регион этого канала!*",
-        VoiceCheckResult.MOVED_CHANNELS: "Переместился {1} -> {0}",
-        VoiceCheckResult.SUCCESS: "Успешно подключился к {0}",
-        VoiceCheckResult.USER_NOT_IN_VOICE: "Вы должны быть в голосовом канале!",
-        VoiceCheckResult.USER_NOT_MEMBER: "Неверный тип пользователя",
-    }
-    msg = messages.get(result, "Неизвестная ошибка")
+    msg = _VOICE_RESULT_MESSAGES.get(result, "Неизвестная ошибка")
     fm1 = to_channel.mention if to_channel else "Неизвестный канал"
     fm2 = from_channel.mention if from_channel else "Неизвестный канал"
 
@@ -115,12 +131,9 @@ class MusicCog(BaseCog):
     async def cog_load(self) -> None:
         if self.bot.is_ready():
             await self.service.initialize()
-        self.auto_leave_monitor.start()
 
     @override
     async def cog_unload(self) -> None:
-        if self.auto_leave_monitor.is_running():
-            self.auto_leave_monitor.cancel()
         await self.service.cleanup()
 
     @commands.Cog.listener()
@@ -165,21 +178,13 @@ class MusicCog(BaseCog):
         except Exception:
             logger.exception("Failed to send track exception message to %s", channel_id)
 
-    @tasks.loop(seconds=config.MUSIC_AUTO_LEAVE_CHECK_INTERVAL)
-    async def auto_leave_monitor(self) -> None:
-        await self.service.check_auto_leave()
-
-    @auto_leave_monitor.before_loop
-    async def before_auto_leave_monitor(self) -> None:
-        await self.bot.wait_until_ready()
-
     @app_commands.command(name="join", description="Подключиться к голосовому каналу")
     @app_commands.guild_only()
     @handle_errors()
     async def join(self, interaction: Interaction) -> None:
         guild = await self._require_guild(interaction)
 
-        channel = await self._get_voice_channel_for_play(interaction)
+        channel = await self._require_voice(interaction)
         if not channel:
             return
 
@@ -230,7 +235,7 @@ class MusicCog(BaseCog):
             )
             return
 
-        channel = await self._get_voice_channel_for_play(interaction)
+        channel = await self._require_voice(interaction)
         if not channel:
             return
 
@@ -255,21 +260,18 @@ class MusicCog(BaseCog):
 
         await self._send_play_feedback(interaction, data, delay_sec)
 
-    async def _get_voice_channel_for_play(
+    async def _require_voice(
         self, interaction: Interaction
     ) -> discord.VoiceChannel | discord.StageChannel | None:
-        if (
-            not isinstance(interaction.user, Member)
-            or not interaction.user.voice
-            or not interaction.user.voice.channel
-        ):
+        """Return the caller's voice channel, or warn privately and return None."""
+        channel = _member_voice_channel(interaction.user)
+        if channel is None:
             await send_warning(
                 interaction,
                 "Вы должны быть в голосовом канале!",
                 ephemeral=True,
             )
-            return None
-        return interaction.user.voice.channel
+        return channel
 
     async def _join_for_join_command(
         self,
@@ -379,22 +381,38 @@ class MusicCog(BaseCog):
             return
         await send_warning_no_player(interaction)
 
+    async def _send_simple_result(
+        self,
+        interaction: Interaction,
+        result: MusicResult[object],
+        success_message: str,
+        *,
+        send: SimpleFeedbackSender | None = None,
+    ) -> None:
+        """Report a command whose only outcome is success or a missing player."""
+        if result.is_success:
+            await (send or send_info)(interaction, success_message)
+        else:
+            await self._send_no_player_or_unavailable(interaction, result)
+
     async def _send_play_feedback(
         self, interaction: Interaction, data: PlayResponseData, delay_sec: float
     ) -> None:
+        requester_name = interaction.user.display_name
+        requester_avatar_url = interaction.user.display_avatar.url
         match data["type"]:
             case "track":
                 embed = build_track_added_embed(
                     data,
-                    requester_name=interaction.user.display_name,
-                    requester_avatar_url=interaction.user.display_avatar.url,
+                    requester_name=requester_name,
+                    requester_avatar_url=requester_avatar_url,
                 )
                 delete_after = min(delay_sec, 480)
             case "playlist":
                 embed = build_playlist_added_embed(
                     data,
-                    requester_name=interaction.user.display_name,
-                    requester_avatar_url=interaction.user.display_avatar.url,
+                    requester_name=requester_name,
+                    requester_avatar_url=requester_avatar_url,
                 )
                 delete_after = min(delay_sec, 600)
 
@@ -421,21 +439,20 @@ class MusicCog(BaseCog):
     @handle_errors()
     async def stop(self, interaction: Interaction) -> None:
         guild = await self._require_guild(interaction)
-        res = await self.service.stop(
-            guild.id, interaction.user.id, interaction.channel_id
+        res = await run_with_defer(
+            interaction,
+            self.service.stop(guild.id, interaction.user.id, interaction.channel_id),
         )
-        if res.is_success:
-            await send_info(interaction, "Остановлено")
-        else:
-            await self._send_no_player_or_unavailable(interaction, res)
+        await self._send_simple_result(interaction, res, "Остановлено")
 
     @app_commands.command(name="skip", description="Пропустить текущий трек")
     @app_commands.guild_only()
     @handle_errors()
     async def skip(self, interaction: Interaction) -> None:
         guild = await self._require_guild(interaction)
-        res = await self.service.skip(
-            guild.id, interaction.user.id, interaction.channel_id
+        res = await run_with_defer(
+            interaction,
+            self.service.skip(guild.id, interaction.user.id, interaction.channel_id),
         )
         if res.status is MusicResultStatus.FAILURE:
             await self._send_no_player_or_unavailable(interaction, res)
@@ -498,7 +515,9 @@ class MusicCog(BaseCog):
             vol = await self.service.get_volume(guild.id)
             return await send_info(interaction, f"Громкость: {vol}%")
 
-        res = await self.service.set_volume(guild.id, value)
+        res = await run_with_defer(
+            interaction, self.service.set_volume(guild.id, value)
+        )
         if res.is_success:
             await send_success(interaction, f"Громкость: {res.data}%")
         else:
@@ -535,10 +554,9 @@ class MusicCog(BaseCog):
         res = await self.service.shuffle(
             guild.id, interaction.user.id, interaction.channel_id
         )
-        if res.is_success:
-            await send_success(interaction, "Перемешано")
-        else:
-            await self._send_no_player_or_unavailable(interaction, res)
+        await self._send_simple_result(
+            interaction, res, "Перемешано", send=send_success
+        )
 
     @app_commands.command(
         name="rotate", description="Переместить тек. трек в конец очереди"
@@ -547,8 +565,9 @@ class MusicCog(BaseCog):
     @handle_errors()
     async def rotate(self, interaction: Interaction) -> None:
         guild = await self._require_guild(interaction)
-        res = await self.service.rotate(
-            guild.id, interaction.user.id, interaction.channel_id
+        res = await run_with_defer(
+            interaction,
+            self.service.rotate(guild.id, interaction.user.id, interaction.channel_id),
         )
         if not res.is_success:
             await self._send_no_player_or_unavailable(interaction, res)
@@ -593,22 +612,18 @@ class MusicCog(BaseCog):
     @handle_errors()
     async def pause(self, interaction: Interaction) -> None:
         guild = await self._require_guild(interaction)
-        res = await self.service.pause(guild.id)
-        if res.is_success:
-            await send_info(interaction, "Воспроизведение приостановлено")
-        else:
-            await self._send_no_player_or_unavailable(interaction, res)
+        res = await run_with_defer(interaction, self.service.pause(guild.id))
+        await self._send_simple_result(
+            interaction, res, "Воспроизведение приостановлено"
+        )
 
     @app_commands.command(name="resume", description="Продолжить")
     @app_commands.guild_only()
     @handle_errors()
     async def resume(self, interaction: Interaction) -> None:
         guild = await self._require_guild(interaction)
-        res = await self.service.resume(guild.id)
-        if res.is_success:
-            await send_info(interaction, "Воспроизведение продолжено")
-        else:
-            await self._send_no_player_or_unavailable(interaction, res)
+        res = await run_with_defer(interaction, self.service.resume(guild.id))
+        await self._send_simple_result(interaction, res, "Воспроизведение продолжено")
 
     @app_commands.command(
         name="reconnect", description="Переподключиться в случае ошибок"
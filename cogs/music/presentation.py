@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import functools
+import math
 import re
 from collections.abc import Sequence
 from dataclasses import dataclass
-from datetime import timedelta
 from itertools import groupby
+from operator import attrgetter
 
 import discord
 
@@ -20,7 +22,13 @@ from api.music.models import (
 from utils import truncate_sequence, truncate_text
 
 MAX_TIMEDELTA_DAYS = 999_999_999
+_track_length = attrgetter("length")
 _MARKDOWN_LINK_BRACKET_RE = re.compile(r"([\[\]])")
+_TRACK_ADDED_TITLES = {
+    "now": "Сейчас играет",
+    "next": "Добавлено в начало очереди",
+    "end": "Добавлено в очередь",
+}
 
 
 @dataclass(frozen=True, slots=True)
@@ -34,19 +42,31 @@ class _TrackGroup:
 
 
 def format_duration(ms: int | float) -> str:
-    """Convert milliseconds to a timedelta string without microseconds."""
+    """Convert milliseconds to a timedelta-style string without microseconds."""
     try:
-        total = timedelta(seconds=ms / 1_000.0)
+        seconds = math.floor(ms / 1_000)
     except OverflowError:
-        total = timedelta(days=min(MAX_TIMEDELTA_DAYS, ms // 86_400_000))
+        return "∞"
     except ValueError:
         return "NaN"
-    total -= timedelta(microseconds=total.microseconds)
-    if total.days >= MAX_TIMEDELTA_DAYS - 1_000_000:
+    return _format_seconds(seconds)
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_seconds(seconds: int) -> str:
+    """Format whole seconds the way :py:class:`datetime.timedelta` prints them."""
+    days, rem = divmod(seconds, 86_400)
+    if days >= MAX_TIMEDELTA_DAYS - 1_000_000:
         return "∞"
-    if total.days >= 14:
-        return str(total.days) + " days"
-    return str(total)
+    if days >= 14:
+        return f"{days} days"
+    hours, rem = divmod(rem, 3_600)
+    minutes, secs = divmod(rem, 60)
+    clock = f"{hours}:{minutes:02d}:{secs:02d}"
+    if not days:
+        return clock
+    plural = "" if abs(days) == 1 else "s"
+    return f"{days} day{plural}, {clock}"
 
 
 def _normalize_inline_text(text: str) -> str:
@@ -75,8 +95,12 @@ def _escape_markdown_link_label(text: str) -> str:
     )
 
 
+@functools.lru_cache(maxsize=4096)
 def format_track_link(title: str, uri: str | None) -> str:
-    """Format a safe track title, linking it only when a URI is available."""
+    """Format a safe track title, linking it only when a URI is available.
+
+    Memoized because queue refreshes re-render the same tracks repeatedly.
+    """
     escaped_title = _escape_markdown_link_label(title)
     if not uri:
         return escaped_title
@@ -155,6 +179,19 @@ def build_session_summary_embed(session: MusicSession) -> discord.Embed:
     return embed
 
 
+def _build_requested_embed(
+    title: str,
+    description: str,
+    *,
+    requester_name: str,
+    requester_avatar_url: str,
+) -> discord.Embed:
+    """Build the common skeleton of feedback for a user's playback request."""
+    embed = discord.Embed(title=title, description=description, color=config.Color.INFO)
+    embed.set_footer(text=f"Запросил: {requester_name}", icon_url=requester_avatar_url)
+    return embed
+
+
 def build_track_added_embed(
     data: TrackResponseData,
     *,
@@ -163,23 +200,15 @@ def build_track_added_embed(
 ) -> discord.Embed:
     """Build feedback for an added or immediately started track."""
     track = data["track"]
-    title_by_placement = {
-        "now": "Сейчас играет",
-        "next": "Добавлено в начало очереди",
-        "end": "Добавлено в очередь",
-    }
-    embed = discord.Embed(
-        title=title_by_placement[data["placement"]],
-        description=format_track_link(track.title, track.uri),
-        color=config.Color.INFO,
+    embed = _build_requested_embed(
+        _TRACK_ADDED_TITLES[data["placement"]],
+        format_track_link(track.title, track.uri),
+        requester_name=requester_name,
+        requester_avatar_url=requester_avatar_url,
     )
     if track.artwork_url:
         embed.set_thumbnail(url=track.artwork_url)
     embed.add_field(name="Длительность", value=format_duration(track.length))
-    embed.set_footer(
-        text=f"Запросил: {requester_name}",
-        icon_url=requester_avatar_url,
-    )
     return embed
 
 
@@ -200,19 +229,16 @@ def build_playlist_added_embed(
     description = f"Треков: {len(playlist.tracks)}"
     if data["placement"] != "end":
         description = f"**{playlist_name}**\n{description}"
-    embed = discord.Embed(
-        title=title_by_placement[data["placement"]],
-        description=description,
-        color=config.Color.INFO,
+    embed = _build_requested_embed(
+        title_by_placement[data["placement"]],
+        description,
+        requester_name=requester_name,
+        requester_avatar_url=requester_avatar_url,
     )
-    duration = sum(track.length for track in playlist.tracks)
+    duration = sum(map(_track_length, playlist.tracks))
     embed.add_field(name="Длительность", value=format_duration(duration))
     if playlist.tracks:
         embed.set_thumbnail(url=playlist.tracks[0].artwork_url or "")
-    embed.set_footer(
-        text=f"Запросил: {requester_name}",
-        icon_url=requester_avatar_url,
-    )
     return embed
 
 
@@ -109,7 +109,7 @@ class TrackControllerManager(ControllerManagerProtocol):
     ):
         """Creates a new controller, replacing any existing one safely."""
         async with self._locks[guild_id]:
-            logger.debug(f"Manager: Setup controller for guild {guild_id}")
+            logger.debug("Manager: Setup controller for guild %s", guild_id)
             if player.current_attempt is not attempt:
                 logger.debug("Manager: Aborting stale controller creation")
                 return
@@ -148,7 +148,7 @@ class TrackControllerManager(ControllerManagerProtocol):
                 )
 
             except Exception as e:
-                logger.exception(f"Failed to send controller: {e}")
+                logger.exception("Failed to send controller: %s", e)
                 view.stop()
 
     @override
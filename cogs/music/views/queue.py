@@ -137,20 +137,51 @@ class QueueUndoView(discord.ui.View):
 
 
 class QueuePaginationAdapter(PaginationData):
-    """Adapts music queue data for the paginator."""
+    """Adapts music queue data for the paginator.
+
+    Everything derived from the snapshot is rendered once per snapshot, so page
+    navigation only assembles an embed from prepared strings.
+    """
+
+    __slots__ = (
+        "_current_artwork",
+        "_current_link",
+        "_footer_suffix",
+        "_paginator",
+        "_total_pages",
+        "page_size",
+        "snapshot",
+    )
 
     def __init__(self, snapshot: QueueSnapshot, page_size: int = 20) -> None:
-        self.snapshot = snapshot
         self.page_size = page_size
-        self._paginator = self._build_paginator(snapshot)
+        self.update_snapshot(snapshot)
 
     def update_snapshot(self, snapshot: QueueSnapshot) -> None:
         self.snapshot = snapshot
         self._paginator = self._build_paginator(snapshot)
+        self._total_pages = max(1, len(self._paginator.pages))
+
+        current = snapshot.current
+        self._current_link = (
+            format_track_link(current.track.title, current.track.uri)
+            if current
+            else None
+        )
+        self._current_artwork = current.track.artwork_url if current else None
+
+        repeat_str = (
+            "выкл."
+            if snapshot.repeat_mode is RepeatMode.OFF
+            else snapshot.repeat_mode.value
+        )
+        self._footer_suffix = (
+            f"В очереди: {self._paginator.total_items} • Повтор: {repeat_str}"
+        )
 
     @override
     async def get_page_count(self) -> int:
-        return max(1, len(self._paginator.pages))
+        return self._total_pages
 
     def _build_paginator(self, snapshot: QueueSnapshot) -> TextPaginator:
         return TextPaginator(
@@ -166,39 +197,24 @@ class QueuePaginationAdapter(PaginationData):
     @override
     def make_embed(self, page: int) -> discord.Embed:
         embed = discord.Embed(title="Очередь воспроизведения", color=config.Color.INFO)
-        current = self.snapshot.current
 
-        if current:
-            track = current.track
+        if self._current_link is not None:
             embed.add_field(
                 name="Сейчас играет",
-                value=format_track_link(track.title, track.uri),
+                value=self._current_link,
                 inline=False,
             )
-            if track.artwork_url:
-                embed.set_thumbnail(url=track.artwork_url)
+            if self._current_artwork:
+                embed.set_thumbnail(url=self._current_artwork)
         else:
             embed.description = "Ничего не играет."
 
-        if 0 <= page < len(self._paginator.pages):
-            embed.add_field(
-                name="Далее",
-                value=self._paginator.pages[page],
-                inline=False,
-            )
+        pages = self._paginator.pages
+        if 0 <= page < len(pages):
+            embed.add_field(name="Далее", value=pages[page], inline=False)
 
-        repeat_str = (
-            "выкл."
-            if self.snapshot.repeat_mode is RepeatMode.OFF
-            else self.snapshot.repeat_mode.value
-        )
-        total_pages = max(1, len(self._paginator.pages))
         embed.set_footer(
-            text=(
-                f"Стр. {page + 1}/{total_pages} • "
-                f"В очереди: {self._paginator.total_items} • "
-                f"Повтор: {repeat_str}"
-            )
+            text=f"Стр. {page + 1}/{self._total_pages} • {self._footer_suffix}"
         )
         return embed
 
@@ -20,6 +20,8 @@ from ..presentation import format_track_link
 class SessionPaginationAdapter(PaginationData):
     """Adapts music session history for the paginator."""
 
+    __slots__ = ("_paginator", "page_size", "session")
+
     def __init__(self, session: MusicSession, page_size: int = 15) -> None:
         self.session = session
         self.page_size = page_size
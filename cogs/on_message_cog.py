@@ -3,13 +3,22 @@
 Listens to messages and responds to greetings.
 """
 
+import asyncio
 import logging
 import secrets
 from collections.abc import Callable, Iterable, Sequence, Sized
 
-from discord import Message
+from discord import (
+    Attachment,
+    Component,
+    Embed,
+    Message,
+    MessageReference,
+    Poll,
+    StickerItem,
+)
 from discord.ext import commands
-from rapidfuzz.process import extract
+from rapidfuzz.process import extractOne
 from rapidfuzz.utils import default_process
 
 import config
@@ -19,6 +28,70 @@ from utils import truncate_text
 
 logger = logging.getLogger(__name__)
 
+# Quest phrases are constant, so normalise them once rather than on every message.
+_MORNING_QUEST = tuple(map(default_process, MORNING_QUEST))
+_EVENING_QUEST = tuple(map(default_process, EVENING_QUEST))
+_INLINE_MATCH_MAX_LENGTH = 256
+_EDIT_TRACKED_ATTRS = (
+    "content",
+    "embeds",
+    "attachments",
+    "stickers",
+    "components",
+    "pinned",
+    "reference",
+)
+
+
+# Log payload factories for ``OnMessageCog._log_section``. They live at module
+# level so logging a message does not rebuild a dozen function objects each time.
+def _no_summary(_: object) -> str:
+    return ""
+
+
+def _attachments_summary(attachments: list[Attachment]) -> object:
+    return [(a.content_type, a.url) for a in attachments]
+
+
+def _attachments_debug(attachments: list[Attachment]) -> object:
+    return {f"att_{i}": a.to_dict() for i, a in enumerate(attachments)}
+
+
+def _embeds_debug(embeds: list[Embed]) -> object:
+    return {f"embed_{i}": e.to_dict() for i, e in enumerate(embeds)}
+
+
+def _stickers_debug(stickers: list[StickerItem]) -> object:
+    return [(s.id, s.name, s.format.name, s.url) for s in stickers]
+
+
+def _reference_summary(reference: MessageReference) -> object:
+    return {
+        "message_id": reference.message_id,
+        "channel_id": reference.channel_id,
+        "guild_id": reference.guild_id,
+    }
+
+
+def _reference_debug(reference: MessageReference) -> object:
+    return reference.to_dict()
+
+
+def _components_debug(components: Sequence[Component]) -> object:
+    return {f"component_{i}": c.to_dict() for i, c in enumerate(components)}
+
+
+def _poll_summary(poll: Poll) -> object:
+    return {"question": poll.question, "options_count": len(poll.answers)}
+
+
+def _poll_debug(poll: Poll) -> object:
+    return getattr(poll, "_to_dict", repr(poll))
+
+
+def _flags_debug(value: int) -> object:
+    return f"{value} (0x{value:x})"
+
 
 class OnMessageCog(commands.Cog):
     """Log, auto-respond to greetings and common phrases."""
@@ -28,20 +101,29 @@ class OnMessageCog(commands.Cog):
 
     @commands.Cog.listener()
     async def on_message(self, message: Message):
-        self._log_message(message)
         if message.author.bot:
             return
-        if message.content.startswith(tuple(await self.bot.get_prefix(message))):
-            return
         if message.guild and await block_manager.is_user_blocked(
             message.guild.id, message.author.id
         ):
             return
+        self._log_message(message)
+        if message.content.startswith(await self._command_prefixes(message)):
+            return
         try:
             await self.quest_process_message(message)
         except Exception as e:
             logger.error("Failed to process message %s: %s", message.content, e)
 
+    async def _command_prefixes(self, message: Message) -> tuple[str, ...]:
+        """Return the bot's command prefixes, awaiting get_prefix only when dynamic."""
+        if isinstance(self.bot.command_prefix, str):
+            return (self.bot.command_prefix,)
+        if isinstance(self.bot.command_prefix, Iterable):
+            return tuple(self.bot.command_prefix)
+        prefix = await self.bot.get_prefix(message)
+        return (prefix,) if isinstance(prefix, str) else tuple(prefix)
+
     def _format_change(self, attr: str, before: object, after: object) -> str:
         """Smart diff formatting by type."""
         if type(before) is not type(after):
@@ -65,31 +147,30 @@ class OnMessageCog(commands.Cog):
 
     @commands.Cog.listener()
     async def on_message_edit(self, before: Message, after: Message):
-        changes: list[str] = []
-
-        attr_whitelist = [
-            "content",
-            "embeds",
-            "attachments",
-            "stickers",
-            "components",
-            "pinned",
-            "reference",
-        ]
-
-        for attr in attr_whitelist:
-            before_val = getattr(before, attr, None)
-            after_val = getattr(after, attr, None)
-
-            if before_val != after_val:
-                changes.append(self._format_change(attr, before_val, after_val))
+        # Edits are only logged, so there is nothing to do when INFO is off.
+        if not logger.isEnabledFor(logging.INFO):
+            return
 
-        if before.flags.value != after.flags.value:
-            before_flags = [name for name, value in before.flags if value]
-            after_flags = [name for name, value in after.flags if value]
-            changes.append(f"flags: {before_flags} -> {after_flags}")
+        changed_attrs = [
+            attr
+            for attr in _EDIT_TRACKED_ATTRS
+            if getattr(before, attr, None) != getattr(after, attr, None)
+        ]
+        flags_changed = before.flags.value != after.flags.value
+        if not changed_attrs and not flags_changed:
+            return
 
-        if changes:
+        if logger.isEnabledFor(logging.DEBUG):
+            changes = [
+                self._format_change(
+                    attr, getattr(before, attr, None), getattr(after, attr, None)
+                )
+                for attr in changed_attrs
+            ]
+            if flags_changed:
+                before_flags = [name for name, value in before.flags if value]
+                after_flags = [name for name, value in after.flags if value]
+                changes.append(f"flags: {before_flags} -> {after_flags}")
             logger.debug(
                 "Message edited by %s in %s | Changes: %s",
                 after.author,
@@ -97,18 +178,24 @@ class OnMessageCog(commands.Cog):
                 ", ".join(changes),
             )
 
-            self._log_message(after, is_edit=True)
+        self._log_message(after, is_edit=True)
 
     async def quest_process_message(self, message: Message):
         if len(message.content) < 5:
             return
-        res = self.process_fuzzy_message(message, MORNING_QUEST, MORNING_ANSWERS)
+        # Scoring grows with message length; keep long ones off the event loop.
+        if len(message.content) > _INLINE_MATCH_MAX_LENGTH:
+            res = await asyncio.to_thread(self._match_quests, message)
+        else:
+            res = self._match_quests(message)
         if res:
             return await message.channel.send(res)
 
-        res = self.process_fuzzy_message(message, EVENING_QUEST, EVENING_ANSWERS)
-        if res:
-            return await message.channel.send(res)
+    def _match_quests(self, message: Message) -> str | None:
+        """Return an answer for the first quest group the message matches."""
+        return self.process_fuzzy_message(
+            message, _MORNING_QUEST, MORNING_ANSWERS
+        ) or self.process_fuzzy_message(message, _EVENING_QUEST, EVENING_ANSWERS)
 
     def process_fuzzy_message(
         self,
@@ -122,7 +209,8 @@ class OnMessageCog(commands.Cog):
 
         Args:
             message: The message to process.
-            quests: A sequence of strings to match against the message content.
+            quests: Strings to match against the message content, already passed
+                through :py:func:`rapidfuzz.utils.default_process`.
             answers: A sequence of strings to return if the message matches.
             threshold: The minimum score required for a match.
 
@@ -130,24 +218,22 @@ class OnMessageCog(commands.Cog):
             A random answer if the message matches, None otherwise.
 
         """
-        fuzzy_results = extract(
-            message.content,
+        best_match = extractOne(
+            default_process(message.content),
             quests,
-            limit=config.FUZZY_MATCH_LIMIT,
-            processor=default_process,
+            score_cutoff=threshold,
         )
-        _, best_score, _ = max(fuzzy_results, key=lambda x: x[1])
 
-        if best_score >= threshold:
+        if best_match is not None:
             logger.info(
                 '%s processed with message: "%s" in %s from %s',
-                str(fuzzy_results[:3]),
+                best_match,
                 message.content,
                 message.channel,
                 message.author,
             )
 
-            return secrets.choice(answers or [None])
+            return secrets.choice(answers) if answers else None
         return None
 
     def _log_section[T](
@@ -163,94 +249,80 @@ class OnMessageCog(commands.Cog):
             self: Self with logger.
             label: The log label (e.g., "Attachments").
             data: The object to check for truthiness before logging.
-            summary_factory: Lambda returning the lightweight INFO payload.
-            debug_factory: Lambda returning the expensive DEBUG payload.
+            summary_factory: Callable returning the lightweight INFO payload.
+            debug_factory: Callable returning the expensive DEBUG payload.
 
         """
         if not data:
             return
         if log_data := summary_factory(data):
-            logger.info(f"{label}: %s", log_data)
+            logger.info("%s: %s", label, log_data)
         if logger.isEnabledFor(logging.DEBUG) and (log_data := debug_factory(data)):
-            logger.debug(f"Full {label.lower()}: %s", log_data)
+            logger.debug("Full %s: %s", label.lower(), log_data)
 
     def _log_message(self, message: Message, *, is_edit: bool = False) -> None:
         """Log message with structured INFO summaries and lazy DEBUG details."""
-        content_flags: dict[str, object] = {
-            "attachments": message.attachments,
-            "embeds": message.embeds,
-            "stickers": message.stickers,
-            "components": message.components,
-            "reference": message.reference,
-            "poll": message.poll,
-        }
+        # Everything below logs at INFO or DEBUG; skip building it when both are off.
+        if not logger.isEnabledFor(logging.INFO):
+            return
         if not is_edit:
+            content_flags = (
+                ("attachments", message.attachments),
+                ("embeds", message.embeds),
+                ("stickers", message.stickers),
+                ("components", message.components),
+                ("reference", message.reference),
+                ("poll", message.poll),
+            )
             logger.info(
                 '%s sent - "%s" in %s (%s)',
                 message.author,
                 message.content,
                 message.channel,
-                ", ".join(k for k, v in content_flags.items() if v),
+                ", ".join([name for name, value in content_flags if value]),
             )
 
         self._log_section(
             "Attachments",
             message.attachments,
-            summary_factory=lambda x: [(a.content_type, a.url) for a in x],
-            debug_factory=lambda x: {f"att_{i}": a.to_dict() for i, a in enumerate(x)},
+            summary_factory=_attachments_summary,
+            debug_factory=_attachments_debug,
         )
-
         self._log_section(
             "Embeds",
             message.embeds,
-            summary_factory=lambda _: "",
-            debug_factory=lambda x: {
-                f"embed_{i}": e.to_dict() for i, e in enumerate(x)
-            },
+            summary_factory=_no_summary,
+            debug_factory=_embeds_debug,
         )
-
         self._log_section(
             "Stickers",
             message.stickers,
-            summary_factory=lambda _: "",
-            debug_factory=lambda x: [(s.id, s.name, s.format.name, s.url) for s in x],
+            summary_factory=_no_summary,
+            debug_factory=_stickers_debug,
         )
-
         self._log_section(
             "Reference",
             message.reference,
-            summary_factory=lambda x: {
-                "message_id": x.message_id,
-                "channel_id": x.channel_id,
-                "guild_id": x.guild_id,
-            },
-            debug_factory=lambda x: x.to_dict(),
+            summary_factory=_reference_summary,
+            debug_factory=_reference_debug,
         )
-
         self._log_section(
             "Components",
             message.components,
-            summary_factory=lambda _: "",
-            debug_factory=lambda x: {
-                f"component_{i}": c.to_dict() for i, c in enumerate(x)
-            },
+            summary_factory=_no_summary,
+            debug_factory=_components_debug,
         )
-
         self._log_section(
             "Poll",
             message.poll,
-            summary_factory=lambda x: {
-                "question": x.question,
-                "options_count": len(x.answers),
-            },
-            debug_factory=lambda x: getattr(x, "_to_dict", repr(x)),
+            summary_factory=_poll_summary,
+            debug_factory=_poll_debug,
         )
-
         self._log_section(
             "Flags",
             message.flags.value,
-            summary_factory=lambda _: "",
-            debug_factory=lambda x: f"{x} (0x{x:x})",
+            summary_factory=_no_summary,
+            debug_factory=_flags_debug,
         )
 
 
@@ -24,6 +24,10 @@ LAVALINK_PASSWORD = os.getenv("LAVALINK_PASSWORD", "")
 LAVALINK_SECURE = os.getenv("LAVALINK_SECURE", "false").lower() == "true"
 LAVALINK_NODE_LABEL = os.getenv("LAVALINK_NODE_LABEL", "MAIN")
 LAVALINK_CONNECT_RETRY_DELAY = float(os.getenv("LAVALINK_CONNECT_RETRY_DELAY", 30.0))
+# When false, the node is only connected by the first music command.
+LAVALINK_CONNECT_ON_STARTUP = (
+    os.getenv("LAVALINK_CONNECT_ON_STARTUP", "true").lower() == "true"
+)
 
 
 # --- Directory structure ---
@@ -81,7 +85,6 @@ DISCONNECT_TIMER_THRESHOLD = 3600  # seconds (1 hour)
 BIRTHDAY_CHECK_INTERVAL = 300  # seconds (5 minutes)
 
 # music_cog.py
-MUSIC_AUTO_LEAVE_CHECK_INTERVAL = 60  # seconds (1 minute)
 MUSIC_AUTO_LEAVE_TIMEOUT = 900  # seconds (15 minutes)
 MUSIC_DEFAULT_VOLUME = 10  # percentage (10%)
 
@@ -101,8 +104,6 @@ WOLFRAM_PLOT_MAX_SIZE = (1200, 1200)
 # Fuzzy matching and search
 FUZZY_THRESHOLD_DEFAULT = 90
 """Minimum fuzzy match score to consider a match (0-100)."""
-FUZZY_MATCH_LIMIT = 10
-"""Maximum number of fuzzy search results to return."""
 SUGGESTION_THRESHOLD = 25
 """Minimum score to show as a suggestion (0-100)."""
 
@@ -13,6 +13,15 @@ from utils.callables import callable_name
 
 logger = logging.getLogger(__name__)
 
+_DISCORD_ERROR_FEEDBACK = (
+    "Discord Ошибка",
+    "Не удалось выполнить действие в Discord. Попробуйте ещё раз.",
+)
+_INTERNAL_ERROR_FEEDBACK = (
+    "Внутренняя ошибка",
+    "Внутренняя ошибка. Детали записаны в лог.",
+)
+
 type AsyncFunc[T, **P] = Callable[P, Awaitable[T]]
 type CommandCallback[CogT, T, **P] = Callable[
     Concatenate[CogT, Interaction, P],
@@ -51,28 +60,25 @@ def handle_errors[CogT, T, **P]() -> Callable[
             """Wrapper that adds error handling."""
             try:
                 return await func(self, interaction, *args, **kwargs)
-            except discord.DiscordException as e:
-                logger.exception("Discord error in %s", func_name)
-                await FeedbackUI.send(
-                    interaction,
-                    title="Discord Ошибка",
-                    feedback_type=FeedbackType.ERROR,
-                    description=(
-                        "Не удалось выполнить действие в Discord. Попробуйте ещё раз."
-                    ),
-                    delete_after=600,
-                    error_info=str(e),
-                )
             except Exception as e:
-                logger.exception("Unexpected error in %s", func_name)
-                await FeedbackUI.send(
-                    interaction,
-                    feedback_type=FeedbackType.ERROR,
-                    title="Внутренняя ошибка",
-                    description="Внутренняя ошибка. Детали записаны в лог.",
-                    delete_after=600,
-                    error_info=str(e),
-                )
+                if isinstance(e, discord.DiscordException):
+                    log_message = "Discord error in %s"
+                    title, description = _DISCORD_ERROR_FEEDBACK
+                else:
+                    log_message = "Unexpected error in %s"
+                    title, description = _INTERNAL_ERROR_FEEDBACK
+                # Answer the user before formatting the traceback into the log.
+                try:
+                    await FeedbackUI.send(
+                        interaction,
+                        feedback_type=FeedbackType.ERROR,
+                        title=title,
+                        description=description,
+                        delete_after=600,
+                        error_info=str(e),
+                    )
+                finally:
+                    logger.error(log_message, func_name, exc_info=e)
             return None
 
         return cast(CommandCallback[CogT, T | None, P], wrapper)
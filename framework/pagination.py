@@ -6,6 +6,8 @@ import discord
 from discord import Interaction
 from discord.ui import Button
 
+from framework.interaction_flow import ack_component
+
 SECONDARY = discord.ButtonStyle.secondary
 """:py:attr:`discord.ButtonStyle.secondary` """
 PRIMARY = discord.ButtonStyle.primary
@@ -17,6 +19,8 @@ DANGER = discord.ButtonStyle.danger
 class PaginationData(Protocol):
     """Protocol defining what data a paginator needs."""
 
+    __slots__ = ()
+
     async def get_page_count(self) -> int:
         """Return the total number of pages."""
         ...
@@ -66,9 +70,7 @@ class ManagedView(discord.ui.View):
     @override
     async def on_timeout(self) -> None:
         """Disable all buttons and remove view on timeout."""
-        for item in self.children:
-            if isinstance(item, Button):
-                item.disabled = True
+        self._disable_all()
         if self._message:
             try:
                 await self._message.edit(view=None)
@@ -76,6 +78,12 @@ class ManagedView(discord.ui.View):
                 pass
         self.stop()
 
+    def _disable_all(self) -> None:
+        """Disable every button attached to the view."""
+        for item in self.children:
+            if isinstance(item, Button):
+                item.disabled = True
+
     async def send(
         self,
         interaction: Interaction,
@@ -116,33 +124,26 @@ class BasePaginator(ManagedView):
 
     def _setup_buttons(self, show_first_last: bool, show_close: bool) -> None:
         """Setup navigation buttons based on configuration."""
+        # Buttons are added to row 0 in the order they are created here.
         if show_first_last:
-            self.first_btn = CallbackButton[Self](
-                self.first_page, label="⏮", style=SECONDARY, row=0
-            )
-            self.add_item(self.first_btn)
-
-        self.next_btn = CallbackButton[Self](
-            self.next_page, label="▶", style=SECONDARY, row=0
-        )
-        self.prev_btn = CallbackButton[Self](
-            self.prev_page, label="◀", style=SECONDARY, row=0
-        )
-
-        self.add_item(self.prev_btn)
-        self.add_item(self.next_btn)
-
+            self.first_btn = self._add_nav_button(self.first_page, "⏮")
+        self.prev_btn = self._add_nav_button(self.prev_page, "◀")
+        self.next_btn = self._add_nav_button(self.next_page, "▶")
         if show_first_last:
-            self.last_btn = CallbackButton[Self](
-                self.last_page, label="⏭", style=SECONDARY, row=0
-            )
-            self.add_item(self.last_btn)
-
+            self.last_btn = self._add_nav_button(self.last_page, "⏭")
         if show_close:
-            self.close_btn = CallbackButton[Self](
-                self.close, label="✕", style=DANGER, row=0
-            )
-            self.add_item(self.close_btn)
+            self.close_btn = self._add_nav_button(self.close, "✕", style=DANGER)
+
+    def _add_nav_button(
+        self,
+        callback: ButtonCallback,
+        label: str,
+        *,
+        style: discord.ButtonStyle = SECONDARY,
+    ) -> CallbackButton[Self]:
+        button = CallbackButton[Self](callback, label=label, style=style, row=0)
+        self.add_item(button)
+        return button
 
     @override
     async def interaction_check(self, interaction: Interaction) -> bool:
@@ -182,9 +183,16 @@ class BasePaginator(ManagedView):
         self.prev_btn.disabled = is_first_page or disable_nav
         self.next_btn.disabled = is_last_page or disable_nav
 
-    async def _update_view(self, interaction: Interaction) -> None:
-        """Update the view with current page."""
-        total_pages = await self.get_total_pages()
+    async def _update_view(
+        self, interaction: Interaction, total_pages: int | None = None
+    ) -> None:
+        """Update the view with current page.
+
+        Callers that already fetched the page count pass it through to avoid a
+        second lookup on the data source.
+        """
+        if total_pages is None:
+            total_pages = await self.get_total_pages()
         if total_pages > 0:
             self.page = min(self.page, total_pages - 1)
         self._update_buttons(total_pages)
@@ -193,33 +201,38 @@ class BasePaginator(ManagedView):
         except discord.NotFound:
             self.stop()
 
+    async def _go_to(
+        self, interaction: Interaction, page: int, total_pages: int | None = None
+    ) -> None:
+        """Show ``page``, skipping the message edit when it is already shown.
+
+        Repeated clicks that arrive before the disabled buttons reach the client
+        are only acknowledged instead of re-sending the same embed.
+        """
+        if page == self.page:
+            await ack_component(interaction)
+            return
+        self.page = page
+        await self._update_view(interaction, total_pages)
+
     async def first_page(self, interaction: Interaction) -> None:
-        self.page = 0
-        await self._update_view(interaction)
+        await self._go_to(interaction, 0)
 
     async def prev_page(self, interaction: Interaction) -> None:
-        self.page = max(0, self.page - 1)
-        await self._update_view(interaction)
+        await self._go_to(interaction, max(0, self.page - 1))
 
     async def next_page(self, interaction: Interaction) -> None:
         total_pages = await self.get_total_pages()
-        if total_pages <= 1:
-            return
-        self.page = min(self.page + 1, total_pages - 1)
-        await self._update_view(interaction)
+        page = max(0, min(self.page + 1, total_pages - 1))
+        await self._go_to(interaction, page, total_pages)
 
     async def last_page(self, interaction: Interaction) -> None:
         total_pages = await self.get_total_pages()
-        if total_pages <= 1:
-            return
-        self.page = total_pages - 1
-        await self._update_view(interaction)
+        await self._go_to(interaction, max(0, total_pages - 1), total_pages)
 
     async def close(self, interaction: Interaction) -> None:
         """Close the paginator."""
-        for item in self.children:
-            if isinstance(item, Button):
-                item.disabled = True
+        self._disable_all()
         try:
             await interaction.response.edit_message(view=None)
         except discord.NotFound:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
 from typing import override
 
@@ -16,56 +17,73 @@ class VolumeData:
     volume: int
 
 
+def _decode_volume(raw: object) -> int | None:
+    if isinstance(raw, bool) or not isinstance(raw, (int, float, str)):
+        return None
+    try:
+        return int(raw)
+    except (ValueError, TypeError):
+        return None
+
+
+def _decode_volumes(data: JsonObject) -> dict[int, int]:
+    volumes: dict[int, int] = {}
+    for gid, raw in data.items():
+        if not gid.isdigit():
+            continue
+        volume = _decode_volume(raw)
+        if volume is not None:
+            volumes[int(gid)] = volume
+    return volumes
+
+
 class VolumeRepository(BaseRepository[VolumeData, int]):
+    """Guild volumes kept in memory and written through to the JSON store.
+
+    The store is read once, on first access; later reads are dict lookups.
+    """
+
     def __init__(self, store: JsonObjectStore | None = None) -> None:
         self._store = store or AsyncJsonFileStore(config.MUSIC_VOLUME_FILE)
+        self._volumes: dict[int, int] | None = None
+        self._load_lock = asyncio.Lock()
+
+    async def _get_volumes(self) -> dict[int, int]:
+        if self._volumes is None:
+            async with self._load_lock:
+                if self._volumes is None:
+                    self._volumes = _decode_volumes(await self._store.read())
+        return self._volumes
 
     @override
     async def get(self, key: int) -> VolumeData | None:
         """Get guild config by guild_id."""
-        data = await self._store.read()
-        raw = data.get(str(key))
-        if raw is None:
-            return None
-        if isinstance(raw, bool):
-            return None
-        if not isinstance(raw, (int, float, str)):
-            return None
-        try:
-            vol = int(raw)
-        except (ValueError, TypeError):
+        vol = (await self._get_volumes()).get(key)
+        if vol is None:
             return None
         return VolumeData(guild_id=key, volume=vol)
 
     @override
     async def get_all(self) -> list[VolumeData]:
-        data = await self._store.read()
-        results: list[VolumeData] = []
-        for gid, vol in data.items():
-            if (
-                not gid.isdigit()
-                or not isinstance(vol, (int, str, float))
-                or isinstance(vol, bool)
-            ):
-                continue
-            results.append(VolumeData(guild_id=int(gid), volume=int(vol)))
-        return results
+        volumes = await self._get_volumes()
+        return [VolumeData(guild_id=gid, volume=vol) for gid, vol in volumes.items()]
 
     @override
     async def save(self, entity: VolumeData, key: int | None = None) -> None:
         def _upd(d: JsonObject) -> None:
             d[str(entity.guild_id)] = entity.volume
 
-        await self._store.update(_upd)
+        await self._get_volumes()
+        self._volumes = _decode_volumes(await self._store.update(_upd))
 
     @override
     async def delete(self, key: int) -> None:
         def _upd(d: JsonObject) -> None:
             d.pop(str(key), None)
 
-        await self._store.update(_upd)
+        await self._get_volumes()
+        self._volumes = _decode_volumes(await self._store.update(_upd))
 
     async def get_volume(self, guild_id: int) -> int:
         """Get the volume for a guild, or the default if not set."""
-        entity = await self.get(guild_id)
-        return entity.volume if entity else config.MUSIC_DEFAULT_VOLUME
+        return (await self._get_volumes()).get(guild_id, config.MUSIC_DEFAULT_VOLUME)
@@ -22,7 +22,11 @@ from api.music.models import (
     VoiceCheckResult,
 )
 from api.music.player import MusicPlayer
-from api.music.service.core_service import CoreMusicService
+from api.music.service.core_service import (
+    SEARCH_CONCURRENCY_LIMIT,
+    CoreMusicService,
+)
+from repositories.volume_repository import VolumeData
 from tests.api.music.helpers import make_entry, make_playlist, make_track
 
 
@@ -63,7 +67,7 @@ class TestCoreMusicServiceAvailability(unittest.IsolatedAsyncioTestCase):
         channel = MagicMock()
         player = MagicMock()
         player.guild = guild
-        player.connected = True
+        player.wait_until_connected = AsyncMock(return_value=True)
         player.set_volume = AsyncMock(side_effect=error)
         player.cleanup = MagicMock()
         guild.voice_client = player
@@ -163,6 +167,16 @@ class TestCoreMusicServiceAvailability(unittest.IsolatedAsyncioTestCase):
         self.connection.ensure_available.assert_not_awaited()
         self.connection.start_lazy_connect.assert_called_once()
 
+    async def test_initialize_defers_connection_when_startup_connect_disabled(
+        self,
+    ) -> None:
+        with patch("config.LAVALINK_CONNECT_ON_STARTUP", False):
+            await self.service.initialize()
+
+        self.events.setup.assert_called_once()
+        self.connection.start_lazy_connect.assert_not_called()
+        self.connection.ensure_available.assert_not_awaited()
+
     async def test_play_returns_unavailable_join_failure_without_player_lookup(
         self,
     ) -> None:
@@ -229,6 +243,7 @@ class TestCoreMusicServiceAvailability(unittest.IsolatedAsyncioTestCase):
                 text_channel_id=2,
             )
 
+        player.fetch_tracks.assert_awaited_once_with("query")
         self.connection.invalidate_player.assert_not_awaited()
         self.connection.invalidate_node_and_players.assert_not_awaited()
         self.assertFalse(player.is_stale)
@@ -240,6 +255,143 @@ class TestCoreMusicServiceAvailability(unittest.IsolatedAsyncioTestCase):
             "Не удалось загрузить трек. Источник временно недоступен или не ответил.",
         )
 
+    async def test_play_retries_suspicious_track_load_failure(self) -> None:
+        guild = MagicMock(id=123)
+        track = make_track("track")
+        entry = QueueEntry(1, track, TrackRequester(1, 2))
+        error = mafic.TrackLoadException(
+            message="rate limited",
+            severity="suspicious",
+            cause="backend detail",
+        )
+        player = MagicMock(guild=guild)
+        player.fetch_tracks = AsyncMock(side_effect=[error, [track]])
+        player.enqueue_tracks = AsyncMock(
+            return_value=EnqueueOutcome((entry,), PlaybackAttempt(1, entry))
+        )
+        join = AsyncMock(return_value=(VoiceCheckResult.SUCCESS, None))
+        self.connection.get_player.return_value = player
+
+        with (
+            patch.object(self.service, "join", join),
+            patch(
+                "api.music.service.core_service.asyncio.sleep", new=AsyncMock()
+            ) as sleep,
+        ):
+            result = await self.service.play(guild, MagicMock(), "query", 1, 2)
+
+        self.assertEqual(player.fetch_tracks.await_count, 2)
+        sleep.assert_awaited_once()
+        self.assertIs(result.status, MusicResultStatus.SUCCESS)
+
+    async def test_concurrent_same_query_searches_share_one_fetch(self) -> None:
+        track = make_track("track")
+        release = asyncio.Event()
+
+        async def fetch_tracks(_query: str) -> list[mafic.Track]:
+            await release.wait()
+            return [track]
+
+        player = MagicMock()
+        player.fetch_tracks = AsyncMock(side_effect=fetch_tracks)
+
+        first = asyncio.create_task(self.service._fetch_tracks(player, "query"))
+        second = asyncio.create_task(self.service._fetch_tracks(player, "query"))
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(first, second)
+        cached = await self.service._fetch_tracks(player, "query")
+
+        self.assertEqual(results, [[track], [track]])
+        self.assertEqual(cached, [track])
+        player.fetch_tracks.assert_awaited_once_with("query")
+
+    async def test_same_query_on_different_nodes_is_not_shared(self) -> None:
+        players = [MagicMock(), MagicMock()]
+        nodes = {
+            id(player): MagicMock(label=label)
+            for label, player in zip(("a", "b"), players, strict=True)
+        }
+        for player in players:
+            player.fetch_tracks = AsyncMock(return_value=[make_track("track")])
+
+        def get_player_node(player: MagicMock) -> MagicMock:
+            return nodes[id(player)]
+
+        self.connection.get_player_node.side_effect = get_player_node
+
+        for player in players:
+            await self.service._fetch_tracks(player, "query")
+
+        for player in players:
+            player.fetch_tracks.assert_awaited_once_with("query")
+
+    async def test_failed_shared_search_is_retried_on_callers_player(self) -> None:
+        release = asyncio.Event()
+        track = make_track("track")
+
+        async def failing_fetch(_query: str) -> list[mafic.Track]:
+            await release.wait()
+            raise mafic.HTTPException(500, "node failed")
+
+        owner, joiner = MagicMock(), MagicMock()
+        owner.fetch_tracks = AsyncMock(side_effect=failing_fetch)
+        joiner.fetch_tracks = AsyncMock(return_value=[track])
+
+        first = asyncio.create_task(self.service._fetch_tracks(owner, "query"))
+        second = asyncio.create_task(self.service._fetch_tracks(joiner, "query"))
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(first, second, return_exceptions=True)
+
+        self.assertIsInstance(results[0], mafic.HTTPException)
+        self.assertEqual(results[1], [track])
+        joiner.fetch_tracks.assert_awaited_once_with("query")
+
+    async def test_distinct_searches_are_limited_to_concurrency_cap(self) -> None:
+        release = asyncio.Event()
+        running = 0
+        peak = 0
+
+        async def fetch_tracks(query: str) -> list[mafic.Track]:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await release.wait()
+            running -= 1
+            return [make_track(query)]
+
+        player = MagicMock()
+        player.fetch_tracks = AsyncMock(side_effect=fetch_tracks)
+
+        searches = [
+            asyncio.create_task(self.service._fetch_tracks(player, f"query {i}"))
+            for i in range(SEARCH_CONCURRENCY_LIMIT + 2)
+        ]
+        for _ in range(5):
+            await asyncio.sleep(0)
+        self.assertEqual(running, SEARCH_CONCURRENCY_LIMIT)
+        release.set()
+        await asyncio.gather(*searches)
+
+        self.assertEqual(peak, SEARCH_CONCURRENCY_LIMIT)
+        self.assertEqual(player.fetch_tracks.await_count, SEARCH_CONCURRENCY_LIMIT + 2)
+
+    async def test_failed_search_is_not_cached(self) -> None:
+        track = make_track("track")
+        error = mafic.TrackLoadException(
+            message="unavailable", severity="COMMON", cause="backend detail"
+        )
+        player = MagicMock()
+        player.fetch_tracks = AsyncMock(side_effect=[error, [track]])
+
+        with self.assertRaises(mafic.TrackLoadException):
+            await self.service._fetch_tracks(player, "query")
+        result = await self.service._fetch_tracks(player, "query")
+
+        self.assertEqual(result, [track])
+        self.assertEqual(player.fetch_tracks.await_count, 2)
+
     async def test_play_enqueues_single_track_at_end_by_default(self) -> None:
         guild = MagicMock(id=123)
         track = make_track("track")
@@ -909,6 +1061,17 @@ class TestCoreMusicServiceAvailability(unittest.IsolatedAsyncioTestCase):
         cancel.assert_called_once()
         disconnect_voice.assert_awaited_once()
 
+    async def test_auto_leave_callback_leaves_known_guild(self) -> None:
+        guild = MagicMock(id=123)
+        self.bot.get_guild.return_value = guild
+        callback = self.state.set_auto_leave_callback.call_args.args[0]
+
+        with patch.object(self.service, "leave", AsyncMock()) as leave:
+            await callback(guild.id)
+
+        self.bot.get_guild.assert_called_once_with(guild.id)
+        leave.assert_awaited_once_with(guild)
+
     async def test_join_returns_unavailable_when_apply_volume_http_not_found(
         self,
     ) -> None:
@@ -922,3 +1085,77 @@ class TestCoreMusicServiceAvailability(unittest.IsolatedAsyncioTestCase):
         await self._assert_apply_volume_error_is_soft_failure(
             aiohttp.ClientConnectionError("down")
         )
+
+    async def test_set_volume_saves_while_player_volume_is_applied(self) -> None:
+        saving = asyncio.Event()
+        release_save = asyncio.Event()
+
+        async def save(_data: object) -> None:
+            saving.set()
+            await release_save.wait()
+
+        async def set_player_volume(_volume: int) -> None:
+            await saving.wait()
+            release_save.set()
+
+        player = MagicMock()
+        player.set_volume = AsyncMock(side_effect=set_player_volume)
+        self.connection.get_player.return_value = player
+        self.volume_repo.save = AsyncMock(side_effect=save)
+
+        result = await asyncio.wait_for(self.service.set_volume(123, 70), 1.0)
+
+        self.assertIs(result.status, MusicResultStatus.SUCCESS)
+        self.assertEqual(result.data, 70)
+        self.volume_repo.save.assert_awaited_once_with(VolumeData(123, 70))
+        player.set_volume.assert_awaited_once_with(70)
+
+    async def test_cancelled_set_volume_cancels_pending_save(self) -> None:
+        save_started = asyncio.Event()
+        save_cancelled = asyncio.Event()
+
+        async def save(_data: object) -> None:
+            save_started.set()
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                save_cancelled.set()
+                raise
+
+        player = MagicMock(applied_volume=None)
+        player.set_volume = AsyncMock(side_effect=asyncio.Event().wait)
+        self.connection.get_player.return_value = player
+        self.volume_repo.save = AsyncMock(side_effect=save)
+
+        command = asyncio.create_task(self.service.set_volume(123, 70))
+        await save_started.wait()
+        command.cancel()
+
+        with self.assertRaises(asyncio.CancelledError):
+            await command
+        self.assertTrue(save_cancelled.is_set())
+
+    async def test_set_volume_skips_player_update_when_unchanged(self) -> None:
+        player = MagicMock(applied_volume=70)
+        player.set_volume = AsyncMock()
+        self.connection.get_player.return_value = player
+        self.volume_repo.save = AsyncMock()
+
+        result = await self.service.set_volume(123, 70)
+
+        self.assertIs(result.status, MusicResultStatus.SUCCESS)
+        self.volume_repo.save.assert_awaited_once_with(VolumeData(123, 70))
+        player.set_volume.assert_not_awaited()
+
+    async def test_join_skips_volume_update_when_already_applied(self) -> None:
+        guild = MagicMock(id=123)
+        player = MagicMock(applied_volume=80)
+        player.set_volume = AsyncMock()
+        self.connection.join = AsyncMock(return_value=(VoiceCheckResult.SUCCESS, None))
+        self.connection.get_player.return_value = player
+        self.volume_repo.get_volume = AsyncMock(return_value=80)
+
+        result = await self.service.join(guild, MagicMock())
+
+        self.assertEqual(result, (VoiceCheckResult.SUCCESS, None))
+        player.set_volume.assert_not_awaited()
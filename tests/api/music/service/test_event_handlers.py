@@ -5,6 +5,7 @@ from typing import override
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import aiohttp
+import discord
 import mafic
 
 from api.music.models import (
@@ -15,6 +16,7 @@ from api.music.models import (
     TrackExceptionPayload,
     TrackRequester,
 )
+from api.music.player import MusicPlayer
 from api.music.service.event_handlers import MusicEventHandlers
 from tests.api.music.helpers import make_track
 
@@ -615,35 +617,63 @@ class TestMusicEventHandlers(unittest.IsolatedAsyncioTestCase):
             1,
         )
 
-    def test_empty_channel_reason_for_channel_without_humans(self) -> None:
+    @staticmethod
+    def _voice_channel(*members: MagicMock) -> MagicMock:
+        """Build a voice channel whose voice states belong to ``members``."""
         channel = MagicMock()
-        channel.members = [MagicMock(bot=True)]
+        by_id = dict(enumerate(members))
+        channel.voice_states = {
+            user_id: member.voice for user_id, member in by_id.items()
+        }
+        channel.guild.get_member.side_effect = by_id.__getitem__
+        return channel
+
+    @staticmethod
+    def _listener(*, self_deaf: bool = False, deaf: bool = False) -> MagicMock:
+        member = MagicMock(bot=False)
+        member.voice.self_deaf = self_deaf
+        member.voice.deaf = deaf
+        return member
+
+    def test_empty_channel_reason_for_channel_without_humans(self) -> None:
+        channel = self._voice_channel(MagicMock(bot=True))
 
         reason = self.handlers._empty_channel_reason(channel)
 
         self.assertEqual(reason, "empty")
 
     def test_empty_channel_reason_for_all_deafened_humans(self) -> None:
-        member = MagicMock(bot=False)
-        member.voice.self_deaf = True
-        member.voice.deaf = False
-        channel = MagicMock()
-        channel.members = [member]
+        channel = self._voice_channel(self._listener(self_deaf=True))
 
         reason = self.handlers._empty_channel_reason(channel)
 
         self.assertEqual(reason, "all_deafened")
 
     def test_empty_channel_reason_is_none_for_active_human(self) -> None:
-        member = MagicMock(bot=False)
-        member.voice.self_deaf = False
-        member.voice.deaf = False
-        channel = MagicMock()
-        channel.members = [member]
+        channel = self._voice_channel(self._listener())
+
+        reason = self.handlers._empty_channel_reason(channel)
+
+        self.assertIsNone(reason)
+
+    def test_empty_channel_reason_ignores_uncached_members(self) -> None:
+        channel = self._voice_channel(self._listener())
+        channel.guild.get_member.side_effect = None
+        channel.guild.get_member.return_value = None
+
+        reason = self.handlers._empty_channel_reason(channel)
+
+        self.assertEqual(reason, "empty")
+
+    def test_empty_channel_reason_stops_at_first_listener(self) -> None:
+        bot, listener = MagicMock(bot=True), self._listener()
+        channel = self._voice_channel(bot, listener, self._listener())
+        channel.guild.get_member.side_effect = [bot, listener, AssertionError()]
 
         reason = self.handlers._empty_channel_reason(channel)
 
         self.assertIsNone(reason)
+        self.assertEqual(channel.guild.get_member.call_count, 2)
 
     async def test_delayed_transition_validation_destroys_disconnected_controller(
         self,
@@ -657,3 +687,70 @@ class TestMusicEventHandlers(unittest.IsolatedAsyncioTestCase):
         self.ui.controller.destroy_for_guild.assert_awaited_once_with(
             1, ControllerDestroyReason.VOICE_DISCONNECT
         )
+
+    async def test_voice_update_ignores_non_music_voice_client(self) -> None:
+        self.bot.user.id = 99
+        member = MagicMock()
+        member.id = 5
+        member.guild.voice_client = MagicMock(spec=mafic.Player)
+        member.guild.voice_client.channel = MagicMock(spec=discord.VoiceChannel)
+        before = MagicMock(channel=member.guild.voice_client.channel)
+
+        with patch.object(self.handlers, "_update_channel_timer") as update_timer:
+            await self.handlers._on_voice_state_update(member, before, MagicMock())
+
+        update_timer.assert_not_called()
+
+    async def test_voice_update_ignores_stale_music_player(self) -> None:
+        self.bot.user.id = 99
+        member = MagicMock()
+        member.id = 5
+        player = MagicMock(spec=MusicPlayer)
+        player.is_stale = True
+        player.channel = MagicMock(spec=discord.VoiceChannel)
+        member.guild.voice_client = player
+        before = MagicMock(channel=player.channel)
+
+        with patch.object(self.handlers, "_update_channel_timer") as update_timer:
+            await self.handlers._on_voice_state_update(member, before, MagicMock())
+
+        update_timer.assert_not_called()
+
+    def test_voice_update_relevance_ignores_non_deafen_changes(self) -> None:
+        bot_channel = MagicMock()
+        other_channel = MagicMock()
+
+        def state(channel: object, *, deaf: bool = False) -> MagicMock:
+            return MagicMock(channel=channel, deaf=False, self_deaf=deaf)
+
+        cases = (
+            (
+                "mute toggle in bot channel",
+                state(bot_channel),
+                state(bot_channel),
+                False,
+            ),
+            (
+                "deafen in bot channel",
+                state(bot_channel),
+                state(bot_channel, deaf=True),
+                True,
+            ),
+            ("join bot channel", state(None), state(bot_channel), True),
+            ("leave bot channel", state(bot_channel), state(other_channel), True),
+            (
+                "deafen elsewhere",
+                state(other_channel),
+                state(other_channel, deaf=True),
+                False,
+            ),
+        )
+
+        for name, before, after, expected in cases:
+            with self.subTest(name):
+                self.assertIs(
+                    self.handlers._is_relevant_voice_state_update(
+                        before, after, bot_channel
+                    ),
+                    expected,
+                )
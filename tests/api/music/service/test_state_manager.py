@@ -2,9 +2,10 @@
 Covers session lifecycle, timer control, and expiry detection.
 """
 
-import time
+import asyncio
 import unittest
 from typing import override
+from unittest.mock import AsyncMock, patch
 
 import mafic
 
@@ -38,14 +39,6 @@ class TestStateManager(unittest.TestCase):
         self.assertIsNone(self.manager.get_session(123))
         self.assertNotIn((123, attempt.attempt_id), self.manager._track_start_times_dt)
 
-    def test_timers(self):
-        self.manager.start_timer(123, "empty")
-        self.assertTrue(self.manager.is_timer_active(123))
-        self.assertIn(123, self.manager.empty_channel_timers)
-
-        self.manager.cancel_timer(123)
-        self.assertFalse(self.manager.is_timer_active(123))
-
     def test_late_end_preserves_new_attempt_start_and_records_old_requester(self):
         first = PlaybackAttempt(
             1,
@@ -77,13 +70,43 @@ class TestStateManager(unittest.TestCase):
             self.fail("expected active session")
         self.assertTrue(session.tracks[-1].skipped)
 
-    def test_get_expired_timers(self):
-        self.manager.start_timer(123, "test")
-        self.manager.empty_channel_timers[123]["timestamp"] = time.monotonic() - 100
 
-        expired = self.manager.get_expired_timers(timeout_duration=50)
-        self.assertEqual(len(expired), 1)
-        self.assertEqual(expired[0][0], 123)
+class TestStateManagerTimers(unittest.IsolatedAsyncioTestCase):
+    @override
+    def setUp(self):
+        self.manager = StateManager()
+        self.callback = AsyncMock()
+        self.manager.set_auto_leave_callback(self.callback)
+
+    async def test_timers(self):
+        self.manager.start_timer(123, "empty")
+        self.assertTrue(self.manager.is_timer_active(123))
+
+        self.manager.cancel_timer(123)
+        self.assertFalse(self.manager.is_timer_active(123))
+
+    async def test_expired_timer_runs_auto_leave_callback(self):
+        with patch("config.MUSIC_AUTO_LEAVE_TIMEOUT", 0):
+            self.manager.start_timer(123, "test")
+        await asyncio.sleep(0.01)
+
+        self.callback.assert_awaited_once_with(123)
+        self.assertFalse(self.manager.is_timer_active(123))
+
+    async def test_cancelled_timer_does_not_run_callback(self):
+        with patch("config.MUSIC_AUTO_LEAVE_TIMEOUT", 0):
+            self.manager.start_timer(123, "test")
+        self.manager.cancel_timer(123)
+        await asyncio.sleep(0.01)
+
+        self.callback.assert_not_awaited()
+
+    async def test_start_timer_keeps_existing_deadline(self):
+        self.manager.start_timer(123, "empty")
+        handle = self.manager._leave_handles[123]
+
+        self.manager.start_timer(123, "all_deafened")
 
-        not_expired = self.manager.get_expired_timers(timeout_duration=200)
-        self.assertEqual(len(not_expired), 0)
+        self.assertIs(self.manager._leave_handles[123], handle)
+        self.manager.cancel_all_timers()
+        self.assertTrue(handle.cancelled())
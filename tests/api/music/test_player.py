@@ -3,12 +3,13 @@
 import asyncio
 import unittest
 from collections import deque
-from typing import cast
+from typing import Any, cast
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import aiohttp
 import mafic
 from discord.types.voice import VoiceServerUpdate as VoiceServerUpdatePayload
+from mafic.typings import PlayerUpdateState
 
 from api.music.models import PlaybackAttempt, QueueEntry, RepeatMode, TrackRequester
 from api.music.player import MusicPlayer
@@ -27,12 +28,20 @@ def _make_player(*, current: QueueEntry | None = None) -> MusicPlayer:
     player._exception_attempt_ids = set()
     player._transition_lock = asyncio.Lock()
     player._is_stale = False
+    player._connected = False
+    player._connected_event = asyncio.Event()
+    player._volume = None
     player._current = current.track if current else None
     player._paused = False
     player.guild = MagicMock(id=123)
     return player
 
 
+def _set_connected_from_update(player: MusicPlayer, state: PlayerUpdateState) -> None:
+    """Stand-in for mafic's ``update_state`` that only tracks ``connected``."""
+    player._connected = state["connected"]
+
+
 def _tracks(player: MusicPlayer) -> list[mafic.Track]:
     return [entry.track for entry in player.queue]
 
@@ -63,6 +72,57 @@ class TestMusicPlayer(unittest.IsolatedAsyncioTestCase):
         player.mark_stale()
         self.assertTrue(player.is_stale)
 
+    async def test_wait_until_connected_wakes_on_connected_player_update(
+        self,
+    ) -> None:
+        player = _make_player()
+        waiter = asyncio.create_task(player.wait_until_connected(1.0))
+        await asyncio.sleep(0)
+        self.assertFalse(waiter.done())
+
+        with patch.object(
+            mafic.Player,
+            "update_state",
+            autospec=True,
+            side_effect=_set_connected_from_update,
+        ):
+            player.update_state(cast(Any, {"connected": True}))
+
+        self.assertTrue(await waiter)
+
+    async def test_cleanup_resets_connected_wait(self) -> None:
+        player = _make_player()
+        player._connected_event.set()
+        player._volume = 80
+
+        with patch.object(mafic.Player, "cleanup", autospec=True):
+            player.cleanup()
+
+        self.assertFalse(player._connected_event.is_set())
+        self.assertIsNone(player.applied_volume)
+        self.assertFalse(await player.wait_until_connected(0.01))
+
+    def test_disconnected_player_update_forgets_applied_volume(self) -> None:
+        player = _make_player()
+        player._volume = 80
+
+        with patch.object(
+            mafic.Player,
+            "update_state",
+            autospec=True,
+            side_effect=_set_connected_from_update,
+        ):
+            player.update_state(cast(Any, {"connected": True}))
+            self.assertEqual(player.applied_volume, 80)
+            player.update_state(cast(Any, {"connected": False}))
+
+        self.assertIsNone(player.applied_volume)
+
+    async def test_wait_until_connected_returns_false_on_timeout(self) -> None:
+        player = _make_player()
+
+        self.assertFalse(await player.wait_until_connected(0.01))
+
     async def test_seek_attempt_waits_for_lock_and_refuses_replacement(self) -> None:
         expected_entry = make_entry("expected", entry_id=1)
         replacement_entry = make_entry("replacement", entry_id=2)
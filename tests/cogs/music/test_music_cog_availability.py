@@ -4,7 +4,7 @@ import asyncio
 import unittest
 from collections.abc import Awaitable
 from typing import Any, cast, override
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import ANY, AsyncMock, MagicMock, patch
 
 import discord
 from discord.ext import commands
@@ -47,6 +47,10 @@ async def _await_operation(
     return await operation
 
 
+async def _await_any_operation[T](_interaction: object, operation: Awaitable[T]) -> T:
+    return await operation
+
+
 class TestMusicCogAvailability(unittest.IsolatedAsyncioTestCase):
     @override
     def setUp(self) -> None:
@@ -57,10 +61,6 @@ class TestMusicCogAvailability(unittest.IsolatedAsyncioTestCase):
         service_mock = MagicMock()
         service_mock.initialize = self.service_initialize
         self.cog.service = cast(CoreMusicService, service_mock)
-        self.auto_leave_start = MagicMock()
-        auto_leave_monitor_mock = MagicMock()
-        auto_leave_monitor_mock.start = self.auto_leave_start
-        self.cog.auto_leave_monitor = auto_leave_monitor_mock
 
     async def test_on_ready_does_not_raise_when_service_init_is_soft(self) -> None:
         await self.cog.on_ready()
@@ -73,7 +73,6 @@ class TestMusicCogAvailability(unittest.IsolatedAsyncioTestCase):
         await self.cog.cog_load()
 
         self.service_initialize.assert_awaited_once()
-        self.auto_leave_start.assert_called_once()
 
     def test_unavailable_voice_message_has_no_raw_backend_details(self) -> None:
         message = _format_voice_result_message(
@@ -87,6 +86,16 @@ class TestMusicCogAvailability(unittest.IsolatedAsyncioTestCase):
         self.assertNotIn("localhost", message)
         self.assertNotIn("traceback", message.lower())
 
+    def test_every_voice_result_has_a_message(self) -> None:
+        channel = MagicMock(mention="<#1>")
+
+        for result in VoiceCheckResult:
+            with self.subTest(result=result):
+                self.assertNotEqual(
+                    _format_voice_result_message(result, channel, channel),
+                    "Неизвестная ошибка",
+                )
+
     async def test_leave_uses_private_defer_flow_for_service_cleanup(self) -> None:
         guild = MagicMock()
         interaction = MagicMock()
@@ -425,3 +434,87 @@ class TestMusicCogJoinVisibility(unittest.IsolatedAsyncioTestCase):
             delete_after=60,
             ephemeral=False,
         )
+
+    async def test_pause_success_sends_info(self) -> None:
+        interaction = MagicMock()
+        self.cog.service.pause = AsyncMock(  # type: ignore[method-assign]
+            return_value=MusicResult(MusicResultStatus.SUCCESS, "ok")
+        )
+
+        with (
+            patch(
+                "cogs.music.music_cog.send_info",
+                new_callable=AsyncMock,
+            ) as send_info,
+            patch.object(
+                self.cog,
+                "_send_no_player_or_unavailable",
+                new_callable=AsyncMock,
+            ) as send_no_player,
+        ):
+            await cast(Any, MusicCog.pause).callback(self.cog, interaction)
+
+        send_info.assert_awaited_once_with(
+            interaction, "Воспроизведение приостановлено"
+        )
+        send_no_player.assert_not_awaited()
+
+    async def test_shuffle_unavailable_uses_no_player_warning(self) -> None:
+        interaction = MagicMock()
+        result: MusicResult[None] = MusicResult(
+            MusicResultStatus.FAILURE, MUSIC_SERVICE_UNAVAILABLE_MESSAGE
+        )
+        self.cog.service.shuffle = AsyncMock(  # type: ignore[method-assign]
+            return_value=result
+        )
+
+        with (
+            patch(
+                "cogs.music.music_cog.send_success",
+                new_callable=AsyncMock,
+            ) as send_success,
+            patch.object(
+                self.cog,
+                "_send_no_player_or_unavailable",
+                new_callable=AsyncMock,
+            ) as send_no_player,
+        ):
+            await cast(Any, MusicCog.shuffle).callback(self.cog, interaction)
+
+        send_no_player.assert_awaited_once_with(interaction, result)
+        send_success.assert_not_awaited()
+
+    async def test_slow_player_commands_run_service_call_through_defer_flow(
+        self,
+    ) -> None:
+        failure: MusicResult[None] = MusicResult(MusicResultStatus.FAILURE, "No player")
+        cases = (
+            ("skip", MusicCog.skip, ()),
+            ("rotate", MusicCog.rotate, ()),
+            ("set_volume", MusicCog.volume, (50,)),
+            ("stop", MusicCog.stop, ()),
+            ("pause", MusicCog.pause, ()),
+            ("resume", MusicCog.resume, ()),
+        )
+
+        for service_method, command, args in cases:
+            interaction = MagicMock()
+            setattr(self.cog.service, service_method, AsyncMock(return_value=failure))
+
+            with (
+                self.subTest(command=command.name),
+                patch(
+                    "cogs.music.music_cog.run_with_defer",
+                    side_effect=_await_any_operation,
+                ) as run_flow,
+                patch.object(
+                    self.cog,
+                    "_send_no_player_or_unavailable",
+                    new_callable=AsyncMock,
+                ),
+                patch("cogs.music.music_cog.send_error", new_callable=AsyncMock),
+            ):
+                await cast(Any, command).callback(self.cog, interaction, *args)
+
+                run_flow.assert_awaited_once_with(interaction, ANY)
+                getattr(self.cog.service, service_method).assert_awaited_once()
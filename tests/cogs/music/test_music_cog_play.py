@@ -7,6 +7,8 @@ from collections.abc import Awaitable
 from typing import Any, cast
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import discord
+
 from api.music.models import (
     MusicResult,
     MusicResultStatus,
@@ -105,7 +107,7 @@ class TestMusicCogPlay(unittest.IsolatedAsyncioTestCase):
             ),
             patch.object(
                 cog,
-                "_get_voice_channel_for_play",
+                "_require_voice",
                 new=AsyncMock(return_value=None),
             ),
             patch(
@@ -128,7 +130,7 @@ class TestMusicCogPlay(unittest.IsolatedAsyncioTestCase):
             "cogs.music.music_cog.send_warning",
             new=AsyncMock(),
         ) as send_warning:
-            channel = await cog._get_voice_channel_for_play(interaction)
+            channel = await cog._require_voice(interaction)
 
         self.assertIsNone(channel)
         send_warning.assert_awaited_once_with(
@@ -137,6 +139,22 @@ class TestMusicCogPlay(unittest.IsolatedAsyncioTestCase):
             ephemeral=True,
         )
 
+    async def test_voice_preflight_returns_member_channel(self) -> None:
+        cog = _make_cog()
+        interaction = _make_interaction()
+        interaction.user = MagicMock(spec=discord.Member)
+        channel = MagicMock(spec=discord.VoiceChannel)
+        interaction.user.voice.channel = channel
+
+        with patch(
+            "cogs.music.music_cog.send_warning",
+            new=AsyncMock(),
+        ) as send_warning:
+            result = await cog._require_voice(interaction)
+
+        self.assertIs(result, channel)
+        send_warning.assert_not_awaited()
+
     async def test_run_play_command_calls_service_with_requested_placement(
         self,
     ) -> None:
@@ -174,7 +192,7 @@ class TestMusicCogPlay(unittest.IsolatedAsyncioTestCase):
             patch.object(cog, "_require_guild", new=AsyncMock(return_value=guild)),
             patch.object(
                 cog,
-                "_get_voice_channel_for_play",
+                "_require_voice",
                 new=AsyncMock(return_value=channel),
             ),
             patch.object(
@@ -231,7 +249,7 @@ class TestMusicCogPlay(unittest.IsolatedAsyncioTestCase):
             patch.object(cog, "_require_guild", new=AsyncMock(return_value=guild)),
             patch.object(
                 cog,
-                "_get_voice_channel_for_play",
+                "_require_voice",
                 new=AsyncMock(return_value=channel),
             ),
             patch.object(
@@ -3,10 +3,12 @@
 import unittest
 
 from api.music import MusicSession
-from api.music.models import PlaylistResponseData, PlayPlacement
+from api.music.models import PlaylistResponseData, PlayPlacement, TrackResponseData
 from cogs.music.presentation import (
     build_playlist_added_embed,
     build_session_summary_embed,
+    build_track_added_embed,
+    format_duration,
     format_track_link,
 )
 from tests.api.music.helpers import make_playlist, make_track
@@ -63,6 +65,35 @@ class TestTrackLinkFormatting(unittest.TestCase):
             format_track_link("Line one\nLine two", None), "Line one Line two"
         )
 
+    def test_repeated_calls_reuse_cached_link(self) -> None:
+        format_track_link.cache_clear()
+
+        first = format_track_link("Cached **title**", "https://good.invalid")
+        second = format_track_link("Cached **title**", "https://good.invalid")
+
+        self.assertIs(first, second)
+        self.assertEqual(format_track_link.cache_info().hits, 1)
+
+
+class TestDurationFormatting(unittest.TestCase):
+    def test_matches_timedelta_style_output(self) -> None:
+        cases = (
+            (0, "0:00:00"),
+            (59_999, "0:00:59"),
+            (3_600_000, "1:00:00"),
+            (86_400_000 + 61_000, "1 day, 0:01:01"),
+            (2 * 86_400_000, "2 days, 0:00:00"),
+            (14 * 86_400_000, "14 days"),
+            (1_500.5, "0:00:01"),
+            (2**63 - 1, "∞"),
+            (float("inf"), "∞"),
+            (float("nan"), "NaN"),
+        )
+
+        for ms, expected in cases:
+            with self.subTest(ms=ms):
+                self.assertEqual(format_duration(ms), expected)
+
 
 class TestPlaylistPresentation(unittest.TestCase):
     def test_escapes_and_normalizes_playlist_name(self) -> None:
@@ -104,6 +135,51 @@ class TestPlaylistPresentation(unittest.TestCase):
 
                 self.assertEqual(embed.title, expected_title)
                 self.assertEqual(embed.description, expected_description)
+                self.assertEqual(embed.footer.text, "Запросил: Requester")
+                self.assertEqual(
+                    embed.footer.icon_url, "https://example.com/avatar.png"
+                )
+
+    def test_sums_playlist_track_lengths(self) -> None:
+        playlist = make_playlist(
+            "Mix",
+            [make_track("one", length=61_000), make_track("two", length=3_600_000)],
+        )
+        data: PlaylistResponseData = {
+            "type": "playlist",
+            "playlist": playlist,
+            "undo_entries": (),
+            "placement": "end",
+        }
+
+        embed = build_playlist_added_embed(
+            data,
+            requester_name="Requester",
+            requester_avatar_url="https://example.com/avatar.png",
+        )
+
+        self.assertEqual(embed.fields[0].name, "Длительность")
+        self.assertEqual(embed.fields[0].value, "1:01:01")
+
+
+class TestTrackAddedPresentation(unittest.TestCase):
+    def test_uses_placement_title_and_requester_footer(self) -> None:
+        data: TrackResponseData = {
+            "type": "track",
+            "track": make_track("one"),
+            "undo_entries": (),
+            "placement": "next",
+        }
+
+        embed = build_track_added_embed(
+            data,
+            requester_name="Requester",
+            requester_avatar_url="https://example.com/avatar.png",
+        )
+
+        self.assertEqual(embed.title, "Добавлено в начало очереди")
+        self.assertEqual(embed.footer.text, "Запросил: Requester")
+        self.assertEqual(embed.footer.icon_url, "https://example.com/avatar.png")
 
 
 class TestSessionSummaryPresentation(unittest.TestCase):
@@ -104,6 +104,19 @@ class TestQueuePaginator(unittest.IsolatedAsyncioTestCase):
             self.fail("Queue field is missing")
         self.assertIn("Track two", queue_value)
 
+    def test_page_render_reuses_snapshot_formatting(self) -> None:
+        snapshot = _make_snapshot("one", "two", current_identifier="current")
+        adapter = QueuePaginationAdapter(snapshot, page_size=1)
+
+        with patch("cogs.music.views.queue.format_track_link") as format_link:
+            embed = adapter.make_embed(1)
+
+        format_link.assert_not_called()
+        self.assertEqual(
+            embed.fields[0].value, "[Track current](https://example.com/current)"
+        )
+        self.assertEqual(embed.footer.text, "Стр. 2/2 • В очереди: 2 • Повтор: выкл.")
+
     async def test_refresh_replaces_snapshot_and_returns_to_first_page(self) -> None:
         initial = _make_snapshot("old-one", "old-two")
         refreshed = _make_snapshot("new-one", "new-two")
@@ -0,0 +1,138 @@
+"""Tests for the automatic message-response cog."""
+
+from __future__ import annotations
+
+import logging
+import unittest
+from typing import Any, cast
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from discord.ext import commands
+
+from cogs.on_message_cog import OnMessageCog
+
+
+class TestOnMessageCog(unittest.IsolatedAsyncioTestCase):
+    def _make_cog(self, prefix: Any) -> OnMessageCog:
+        bot = MagicMock(spec=commands.Bot)
+        bot.command_prefix = prefix
+        bot.get_prefix = AsyncMock(return_value=["?"])
+        return OnMessageCog(bot)
+
+    def _message(self, content: str) -> MagicMock:
+        message = MagicMock()
+        message.content = content
+        message.author.bot = False
+        message.guild = None
+        return message
+
+    async def test_static_prefix_is_matched_as_a_whole(self) -> None:
+        cog = self._make_cog("s!")
+        cog.quest_process_message = AsyncMock()
+
+        plain = self._message("sun is up")
+
+        with patch.object(cog, "_log_message"):
+            await cog.on_message(cast(Any, self._message("s!help")))
+            await cog.on_message(cast(Any, plain))
+
+        cog.quest_process_message.assert_awaited_once_with(plain)
+        cast(AsyncMock, cog.bot.get_prefix).assert_not_awaited()
+
+    async def test_callable_prefix_is_resolved_per_message(self) -> None:
+        cog = self._make_cog(commands.when_mentioned_or("?"))
+        cog.quest_process_message = AsyncMock()
+
+        with patch.object(cog, "_log_message"):
+            await cog.on_message(cast(Any, self._message("?help")))
+
+        cast(AsyncMock, cog.bot.get_prefix).assert_awaited_once()
+        cog.quest_process_message.assert_not_awaited()
+
+    def test_log_message_is_skipped_when_info_is_disabled(self) -> None:
+        cog = self._make_cog("s!")
+        message = MagicMock()
+        logger = logging.getLogger("cogs.on_message_cog")
+
+        with (
+            patch.object(logger, "isEnabledFor", return_value=False),
+            patch.object(logger, "info") as info,
+        ):
+            cog._log_message(cast(Any, message))
+
+        info.assert_not_called()
+
+    async def test_edit_diff_is_only_formatted_for_debug_logging(self) -> None:
+        cog = self._make_cog("s!")
+        before = self._message("old text")
+        after = self._message("new text")
+        before.flags.value = after.flags.value = 0
+        for attr in ("embeds", "attachments", "stickers", "components", "reference"):
+            setattr(before, attr, [])
+            setattr(after, attr, [])
+        before.pinned = after.pinned = False
+        logger = logging.getLogger("cogs.on_message_cog")
+
+        with (
+            # INFO is enabled, DEBUG is not.
+            patch.object(logger, "isEnabledFor", side_effect=logging.INFO.__le__),
+            patch.object(cog, "_log_message") as log_message,
+            patch.object(cog, "_format_change") as format_change,
+        ):
+            await cog.on_message_edit(cast(Any, before), cast(Any, before))
+            log_message.assert_not_called()
+
+            await cog.on_message_edit(cast(Any, before), cast(Any, after))
+
+        log_message.assert_called_once_with(after, is_edit=True)
+        format_change.assert_not_called()
+
+    async def test_long_messages_are_matched_off_the_event_loop(self) -> None:
+        cog = self._make_cog("s!")
+        short, long = self._message("hello"), self._message("x" * 300)
+        for message in (short, long):
+            message.channel.send = AsyncMock()
+
+        with (
+            patch.object(cog, "_match_quests", return_value="hi") as match,
+            patch(
+                "cogs.on_message_cog.asyncio.to_thread",
+                new=AsyncMock(return_value="hi"),
+            ) as to_thread,
+        ):
+            await cog.quest_process_message(cast(Any, short))
+            await cog.quest_process_message(cast(Any, long))
+
+        match.assert_called_once_with(short)
+        to_thread.assert_awaited_once_with(match, long)
+        long.channel.send.assert_awaited_once_with("hi")
+
+    async def test_bot_messages_are_ignored_before_logging(self) -> None:
+        cog = self._make_cog("s!")
+        cog.quest_process_message = AsyncMock()
+        message = self._message("good morning")
+        message.author.bot = True
+
+        with patch.object(cog, "_log_message") as log_message:
+            await cog.on_message(cast(Any, message))
+
+        log_message.assert_not_called()
+        cog.quest_process_message.assert_not_awaited()
+
+    async def test_blocked_user_messages_are_not_logged(self) -> None:
+        cog = self._make_cog("s!")
+        cog.quest_process_message = AsyncMock()
+        message = self._message("good morning")
+        message.guild = MagicMock(id=1)
+
+        with (
+            patch(
+                "cogs.on_message_cog.block_manager.is_user_blocked",
+                new=AsyncMock(return_value=True),
+            ),
+            patch.object(cog, "_log_message") as log_message,
+        ):
+            await cog.on_message(cast(Any, message))
+
+        log_message.assert_not_called()
+        cog.quest_process_message.assert_not_awaited()
@@ -0,0 +1,81 @@
+"""Tests for command error-handling decorators."""
+
+from __future__ import annotations
+
+import inspect
+import unittest
+from typing import Any, cast
+from unittest.mock import ANY, AsyncMock, MagicMock, patch
+
+import discord
+
+from framework.decorators import handle_errors
+from framework.feedback_ui import FeedbackType
+
+
+class _Cog:
+    @handle_errors()
+    async def ok(self, _interaction: discord.Interaction, value: int) -> int:
+        return value
+
+    @handle_errors()
+    async def discord_failure(self, _interaction: discord.Interaction) -> None:
+        raise discord.ClientException("voice busy")
+
+    @handle_errors()
+    async def internal_failure(self, _interaction: discord.Interaction) -> None:
+        raise RuntimeError("boom")
+
+
+class TestHandleErrors(unittest.IsolatedAsyncioTestCase):
+    def test_wrapper_keeps_command_signature(self) -> None:
+        self.assertEqual(
+            list(inspect.signature(_Cog.ok).parameters),
+            ["self", "_interaction", "value"],
+        )
+
+    async def test_success_returns_result_without_feedback(self) -> None:
+        with patch("framework.decorators.FeedbackUI.send", new=AsyncMock()) as send:
+            result = await _Cog().ok(cast(Any, MagicMock()), 7)
+
+        self.assertEqual(result, 7)
+        send.assert_not_awaited()
+
+    async def test_failures_send_matching_error_feedback(self) -> None:
+        cases = (
+            ("discord_failure", "Discord Ошибка", "voice busy"),
+            ("internal_failure", "Внутренняя ошибка", "boom"),
+        )
+
+        for method, expected_title, expected_info in cases:
+            with (
+                self.subTest(method=method),
+                patch("framework.decorators.FeedbackUI.send", new=AsyncMock()) as send,
+                self.assertLogs("framework.decorators", level="ERROR"),
+            ):
+                interaction = MagicMock()
+                result = await getattr(_Cog(), method)(interaction)
+
+                self.assertIsNone(result)
+                send.assert_awaited_once_with(
+                    interaction,
+                    feedback_type=FeedbackType.ERROR,
+                    title=expected_title,
+                    description=ANY,
+                    delete_after=600,
+                    error_info=expected_info,
+                )
+
+    async def test_error_is_logged_even_when_feedback_fails(self) -> None:
+        with (
+            patch(
+                "framework.decorators.FeedbackUI.send",
+                new=AsyncMock(side_effect=discord.HTTPException(MagicMock(), "gone")),
+            ),
+            self.assertLogs("framework.decorators", level="ERROR") as logs,
+            self.assertRaises(discord.HTTPException),
+        ):
+            await _Cog().internal_failure(cast(Any, MagicMock()))
+
+        self.assertIn("Unexpected error in", logs.output[0])
+        self.assertIn("RuntimeError: boom", logs.output[0])
@@ -4,11 +4,11 @@ from __future__ import annotations
 
 import unittest
 from typing import cast
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import discord
 
-from framework.pagination import CallbackButton
+from framework.pagination import BasePaginator, CallbackButton
 
 
 class TestCallbackButton(unittest.IsolatedAsyncioTestCase):
@@ -24,3 +24,74 @@ class TestCallbackButton(unittest.IsolatedAsyncioTestCase):
         await button.callback(interaction)
 
         self.assertEqual(received, [interaction])
+
+
+class TestBasePaginatorButtons(unittest.IsolatedAsyncioTestCase):
+    async def test_buttons_are_added_in_row_order(self) -> None:
+        paginator = BasePaginator(MagicMock(), user_id=1)
+
+        labels = [
+            item.label
+            for item in paginator.children
+            if isinstance(item, CallbackButton)
+        ]
+
+        self.assertEqual(labels, ["⏮", "◀", "▶", "⏭", "✕"])
+        self.assertIs(paginator.close_btn.style, discord.ButtonStyle.danger)
+
+    async def test_optional_buttons_are_skipped(self) -> None:
+        paginator = BasePaginator(
+            MagicMock(), user_id=1, show_first_last=False, show_close=False
+        )
+
+        self.assertEqual(len(paginator.children), 2)
+        self.assertFalse(hasattr(paginator, "first_btn"))
+        self.assertFalse(hasattr(paginator, "close_btn"))
+
+    async def test_next_page_fetches_page_count_once(self) -> None:
+        data = MagicMock()
+        data.get_page_count = AsyncMock(return_value=3)
+        paginator = BasePaginator(data, user_id=1)
+        interaction = MagicMock()
+        interaction.response.edit_message = AsyncMock()
+
+        await paginator.next_page(interaction)
+
+        self.assertEqual(paginator.page, 1)
+        data.get_page_count.assert_awaited_once()
+        interaction.response.edit_message.assert_awaited_once()
+
+    async def test_navigation_to_current_page_only_acknowledges(self) -> None:
+        data = MagicMock()
+        data.get_page_count = AsyncMock(return_value=3)
+        paginator = BasePaginator(data, user_id=1)
+        paginator.page = 2
+        interaction = MagicMock()
+        interaction.response.edit_message = AsyncMock()
+
+        with patch(
+            "framework.pagination.ack_component", new=AsyncMock()
+        ) as ack_component:
+            await paginator.next_page(interaction)
+            await paginator.last_page(interaction)
+
+        self.assertEqual(paginator.page, 2)
+        self.assertEqual(ack_component.await_count, 2)
+        interaction.response.edit_message.assert_not_awaited()
+        data.make_embed.assert_not_called()
+
+    async def test_close_disables_every_button(self) -> None:
+        paginator = BasePaginator(MagicMock(), user_id=1)
+        interaction = MagicMock()
+        interaction.response.edit_message = AsyncMock()
+
+        await paginator.close(interaction)
+
+        self.assertTrue(
+            all(
+                item.disabled
+                for item in paginator.children
+                if isinstance(item, CallbackButton)
+            )
+        )
+        self.assertTrue(paginator.is_finished())
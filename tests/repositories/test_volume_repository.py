@@ -105,3 +105,39 @@ class TestVolumeRepository(unittest.IsolatedAsyncioTestCase):
         final_data = self.store.data
         self.assertNotIn("123", final_data)
         self.assertIn("456", final_data)
+
+    async def test_reads_store_once_and_serves_from_memory(self) -> None:
+        self.store = InMemoryJsonStore({"123": 50})
+        self.repo = VolumeRepository(store=self.store)
+
+        with patch.object(self.store, "read", wraps=self.store.read) as read:
+            self.assertEqual(await self.repo.get_volume(123), 50)
+            self.assertEqual(await self.repo.get_volume(123), 50)
+            self.assertEqual(await self.repo.get_volume(999), 100)
+
+        read.assert_awaited_once()
+
+    async def test_save_and_delete_update_cached_volumes(self) -> None:
+        self.store = InMemoryJsonStore({"123": 50})
+        self.repo = VolumeRepository(store=self.store)
+        self.assertEqual(await self.repo.get_volume(123), 50)
+
+        await self.repo.save(VolumeData(123, 75))
+        self.assertEqual(await self.repo.get_volume(123), 75)
+
+        await self.repo.delete(123)
+        self.assertEqual(await self.repo.get_volume(123), 100)
+        self.assertEqual(self.store.data, {})
+
+    async def test_get_all_skips_invalid_entries(self) -> None:
+        self.store = InMemoryJsonStore(
+            {"123": 50, "456": "80", "bad": 10, "789": True, "321": "loud"}
+        )
+        self.repo = VolumeRepository(store=self.store)
+
+        entries = await self.repo.get_all()
+
+        self.assertEqual(
+            sorted(entries, key=lambda e: e.guild_id),
+            [VolumeData(123, 50), VolumeData(456, 80)],
+        )